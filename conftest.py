@@ -7,6 +7,9 @@ import os
 import sys
 from pathlib import Path
 
+import pytest
+from dotenv import load_dotenv
+
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
@@ -15,3 +18,33 @@ if "PYTHONPATH" in os.environ:
     os.environ["PYTHONPATH"] = f"{project_root}:{os.environ['PYTHONPATH']}"
 else:
     os.environ["PYTHONPATH"] = str(project_root)
+
+load_dotenv(project_root / ".env")
+
+
+def pytest_configure(config):
+    """Register the project's custom markers."""
+    config.addinivalue_line(
+        "markers", "llm_smoke: smoke tests that call a live LLM provider"
+    )
+    config.addinivalue_line(
+        "markers",
+        "slow: tests excluded from the default run (deselect with -m 'not slow')",
+    )
+    config.addinivalue_line("markers", "fast: pure in-memory tests using stub tools")
+    config.addinivalue_line(
+        "markers", "mock_http: tool tests that run against a mocked HTTP client"
+    )
+
+
+@pytest.fixture(scope="session")
+def vcr_config():
+    """
+    Record live HTTP traffic once per cassette and replay it afterwards.
+    Credentials are scrubbed so cassettes can be committed.
+    """
+    return {
+        "record_mode": "once",
+        "filter_headers": ["authorization", "x-goog-api-key"],
+        "filter_query_parameters": ["appid"],
+    }
@@ -33,7 +33,11 @@ class Application:
         self.preprocess_args()
         self.validate_arguments()
         self.initialize_agent()
-        answer, processing_time = self.run_agent()
+        try:
+            answer, processing_time = self.run_agent()
+        finally:
+            if self.agent is not None:
+                self.agent.close()
         if self.verbose:
             self.print_metrics(processing_time)
             print("=== Answer ===")
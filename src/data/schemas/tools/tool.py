@@ -1,9 +1,9 @@
 """Schema for Tool Suggestion"""
 
-import json
 from typing import Union
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic_core import from_json
 
 ToolArgValue = Union[str, float, int]
 ToolArgs = dict[str, ToolArgValue]
@@ -143,18 +143,23 @@ class ToolPlan(BaseModel):
 
     @classmethod
     def from_json_string(cls, json_str: str) -> "ToolPlan":
-        """Create ToolPlan from JSON string."""
+        """
+        Create ToolPlan from JSON string.
+
+        The JSON is parsed by pydantic-core and all suggestions are validated
+        in one model_validate call instead of building each one separately.
+        """
         try:
-            data = json.loads(json_str)
-            if isinstance(data, list):
-                return cls.from_list(data)
-            elif isinstance(data, dict) and "suggestions" in data:
-                return cls.from_list(data["suggestions"])
-            else:
-                raise ValueError("Invalid JSON structure for ToolPlan")
-        except json.JSONDecodeError as e:
+            data = from_json(json_str)
+        except ValueError as e:
             raise ValueError(f"Invalid JSON: {str(e)}")
 
+        if isinstance(data, dict) and "suggestions" in data:
+            data = data["suggestions"]
+        elif not isinstance(data, list):
+            raise ValueError("Invalid JSON structure for ToolPlan")
+        return cls.model_validate({"suggestions": data})
+
     def __len__(self) -> int:
         """Return number of suggestions."""
         return len(self.suggestions)
@@ -1,20 +1,28 @@
 """Schema for Tool Response"""
 
-from typing import Optional, Union
+from typing import NamedTuple, Optional, Union
 
-from pydantic import BaseModel, Field
 
+class ToolResponse(NamedTuple):
+    """
+    Represents a response from a tool execution.
 
-class ToolResponse(BaseModel):
-    """Represents a response from a tool execution."""
+    Tool responses are built by the agent after a tool has run, so they skip
+    pydantic validation; untrusted LLM output is validated by ToolPlan instead.
 
-    tool: str = Field(..., description="Name of the tool that was executed")
-    args: dict[str, Union[str, float, int]] = Field(
-        ..., description="Arguments passed to the tool"
-    )
-    result: Optional[str] = Field(None, description="Result from tool execution")
-    success: bool = Field(..., description="Whether the tool execution was successful")
-    error: Optional[str] = Field(None, description="Error message if execution failed")
+    Attributes:
+        tool: Name of the tool that was executed
+        args: Arguments passed to the tool
+        success: Whether the tool execution was successful
+        result: Result from tool execution
+        error: Error message if execution failed
+    """
+
+    tool: str
+    args: dict[str, Union[str, float, int]]
+    success: bool
+    result: Optional[str] = None
+    error: Optional[str] = None
 
     def is_successful(self) -> bool:
         """Check if the tool execution was successful."""
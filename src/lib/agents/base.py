@@ -1,5 +1,6 @@
 import time
 from abc import ABC
+from typing import Iterable, Iterator
 
 from ...constants.llm import FUSE_FORMAT_MESSAGE
 from ...constants.messages import FAILED_AGENT_MESSAGE
@@ -9,6 +10,13 @@ from ..llm.base import LLMStrategy
 from ..loggers import agent_logger
 from ..tools.tool_invoker import ToolInvokerBase
 
+FUSE_PROMPT_PREFIX = f"""
+            You are an agent tasked with fusing tool responses into a single final answer.
+
+            Formatting Rules:
+            {FUSE_FORMAT_MESSAGE}
+"""
+
 
 class Agent(ABC):
     """Abstract base class implementing the Template Method pattern for agents."""
@@ -17,38 +25,93 @@ class Agent(ABC):
         self.llm_strategy = llm_strategy
         self.tool_invoker = tool_invoker
 
+    def close(self) -> None:
+        """Release the resources held by the agent's tools."""
+        self.tool_invoker.close()
+
     def answer(self, query: str) -> str:
         """
         Template method that defines the algorithm for answering queries.
         This method cannot be overridden by subclasses.
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         agent_logger.log_query_start(query)
 
         try:
             processed_query = self.preprocess_query(query)
-            tool_plan = self.get_tool_suggestions(processed_query)
-            self.tool_plan = [
-                suggestion.model_dump() for suggestion in tool_plan.suggestions
-            ]
-            agent_logger.log_tool_plan(
-                [suggestion.model_dump() for suggestion in tool_plan.suggestions]
-            )
-
-            tool_responses = self.execute_tools(tool_plan)
-            processed_responses = self.postprocess_responses(tool_responses)
+            processed_responses = self._plan_and_execute(processed_query)
             result = self.fuse_responses(processed_responses, processed_query)
 
-            processing_time = time.time() - start_time
+            processing_time = (time.perf_counter_ns() - start_time) / 1e9
             agent_logger.log_query_success(query, result, processing_time)
 
             return result
 
         except Exception as e:
-            processing_time = time.time() - start_time
+            processing_time = (time.perf_counter_ns() - start_time) / 1e9
             agent_logger.log_query_failure(query, str(e), processing_time)
             return FAILED_AGENT_MESSAGE
 
+    def answer_stream(self, query: str) -> Iterator[str]:
+        """
+        Streaming variant of answer() that yields the final answer in chunks
+        as the LLM produces them, instead of waiting for the full completion.
+
+        The joined chunks are stripped like answer()'s result. If the stream
+        fails after some chunks were yielded, the failure message follows them
+        on a new line so a cut-short answer is not mistaken for a complete one.
+        """
+        start_time = time.perf_counter_ns()
+        agent_logger.log_query_start(query)
+        chunks: list[str] = []
+
+        try:
+            processed_query = self.preprocess_query(query)
+            processed_responses = self._plan_and_execute(processed_query)
+            for chunk in self._strip_stream(
+                self.llm_strategy.query_stream(
+                    self._build_fuse_prompt(processed_responses, processed_query)
+                )
+            ):
+                chunks.append(chunk)
+                yield chunk
+
+        except Exception as e:
+            processing_time = (time.perf_counter_ns() - start_time) / 1e9
+            agent_logger.log_query_failure(query, str(e), processing_time)
+            yield f"\n{FAILED_AGENT_MESSAGE}" if chunks else FAILED_AGENT_MESSAGE
+            return
+
+        processing_time = (time.perf_counter_ns() - start_time) / 1e9
+        agent_logger.log_query_success(query, "".join(chunks), processing_time)
+
+    @staticmethod
+    def _strip_stream(chunks: Iterable[str]) -> Iterator[str]:
+        """
+        Yield chunks so that together they equal "".join(chunks).strip().
+        Leading whitespace is dropped and trailing whitespace is held back
+        until more text follows it.
+        """
+        started, pending = False, ""
+        for chunk in chunks:
+            text = pending + chunk if started else chunk.lstrip()
+            stripped = text.rstrip()
+            pending = text[len(stripped) :]
+            if stripped:
+                started = True
+                yield stripped
+
+    def _plan_and_execute(self, processed_query: str) -> tuple[ToolResponse, ...]:
+        """Plan the tools for a query, execute them and post-process the responses."""
+        tool_plan = self.get_tool_suggestions(processed_query)
+        self.tool_plan = [
+            suggestion.model_dump() for suggestion in tool_plan.suggestions
+        ]
+        agent_logger.log_tool_plan(tuple(self.tool_plan))
+
+        tool_responses = self.execute_tools(tool_plan)
+        return self.postprocess_responses(tool_responses)
+
     def get_tool_suggestions(self, query: str) -> ToolPlan:
         """Get tool suggestions from the LLM strategy."""
         return self.llm_strategy.refine(query)
@@ -62,22 +125,21 @@ class Agent(ABC):
         Execute tools recursively. First execute non-calculator tools,
         then use their responses to potentially invoke calculator tools.
         """
-        responses: list[ToolResponse] = []
-        has_multiple_plans = len(tool_plan.suggestions) > 1
-        should_try_again: bool = False
-        for suggestion in tool_plan.suggestions:
-            has_depends_on = len(suggestion.depends_on) > 0
-            if (
-                has_multiple_plans
-                and has_depends_on
-                and suggestion.tool == "calculator"
-            ):
-                should_try_again = True
-                continue
-            response = self._execute_single_tool(suggestion)
-            responses.append(response)
-
-        if should_try_again:
+        suggestions = tool_plan.suggestions
+        has_multiple_plans = len(suggestions) > 1
+        deferred = [
+            has_multiple_plans
+            and suggestion.tool == "calculator"
+            and bool(suggestion.depends_on)
+            for suggestion in suggestions
+        ]
+        responses: list[ToolResponse] = [
+            self._execute_single_tool(suggestion)
+            for suggestion, is_deferred in zip(suggestions, deferred)
+            if not is_deferred
+        ]
+
+        if any(deferred):
             new_tool_plan = self._evaluate_calculator_dependencies(responses)
             responses.extend(self.execute_tools(new_tool_plan))
 
@@ -86,69 +148,75 @@ class Agent(ABC):
     def _evaluate_calculator_dependencies(
         self, responses: list[ToolResponse]
     ) -> ToolPlan:
-        """Evaluate depends_on for calculator tools."""
+        """
+        Evaluate depends_on for calculator tools.
+        The re-plan prompt lists each earlier response, separated by "; ".
+        """
         response_summary = (
             "Based on these results: "
-            + "; ".join(str(responses))
+            + "; ".join(str(response) for response in responses)
             + ". What calculations should be performed?"
         )
         tool_plan_for_calculators = self.get_tool_suggestions(response_summary)
         self.tool_plan.extend(
-            [
-                suggestion.model_dump()
-                for suggestion in tool_plan_for_calculators.suggestions
-            ]
+            suggestion.model_dump()
+            for suggestion in tool_plan_for_calculators.suggestions
         )
         return tool_plan_for_calculators
 
     def _execute_single_tool(self, suggestion: ToolSuggestion) -> ToolResponse:
-        """Execute a single tool and return the response."""
+        """
+        Execute a single tool and return the response.
+
+        Tool failures come back from the invoker as unsuccessful responses;
+        only a tool that cannot be set up (e.g. missing configuration) is
+        caught here.
+        """
         try:
             self.tool_invoker.set_action(suggestion.tool)
-            result = self.tool_invoker.execute(suggestion.args)
-
-            return ToolResponse(
-                tool=suggestion.tool,
-                args=suggestion.args,
-                result=result,
-                success=True,
-                error=None,
-            )
-
         except Exception as e:
             return ToolResponse(
                 tool=suggestion.tool,
                 args=suggestion.args,
-                result=None,
                 success=False,
                 error=str(e),
             )
 
+        return self.tool_invoker.execute(suggestion.args)
+
     def preprocess_query(self, query: str) -> str:
-        """Hook method for preprocessing the query. Default: no preprocessing."""
+        """Hook method for preprocessing the query. Default: strip and lowercase."""
         return query.strip().lower()
 
     def postprocess_responses(
         self, responses: list[ToolResponse]
-    ) -> list[ToolResponse]:
-        """Hook method for post-processing tool responses. Default: no post-processing."""
-        return responses
+    ) -> tuple[ToolResponse, ...]:
+        """Hook method for post-processing tool responses. Default: freeze into a tuple."""
+        return tuple(responses)
 
-    def fuse_responses(self, responses: list[ToolResponse], query: str) -> str:
+    def fuse_responses(self, responses: tuple[ToolResponse, ...], query: str) -> str:
         """
         Fuse tool responses into a final answer using an LLM,
         with stricter formatting and validation.
+
+        The static instructions come first so provider-side prompt caching
+        can reuse them across queries.
         """
+        return self.llm_strategy.query(
+            self._build_fuse_prompt(responses, query)
+        ).strip()
+
+    def _build_fuse_prompt(
+        self, responses: tuple[ToolResponse, ...], query: str
+    ) -> str:
+        """Build the LLM prompt used to fuse tool responses into an answer."""
         response_text = "\n".join(
             f"- Response {i+1}: {response.get_result_or_error()}"
             for i, response in enumerate(responses)
             if response.is_successful()
         )
 
-        answer = self.llm_strategy.query(
-            f"""
-            You are an agent tasked with fusing tool responses into a single final answer.
-
+        return f"""{FUSE_PROMPT_PREFIX}
             Tools Used:
             {self.tool_plan}
 
@@ -157,10 +225,4 @@ class Agent(ABC):
 
             Original Query:
             {query}
-
-            Formatting Rules:
-            {FUSE_FORMAT_MESSAGE}
         """
-        ).strip()
-
-        return answer
@@ -1,7 +1,8 @@
 """Generic API Client"""
 
+import json
 import time
-from typing import Optional, Union
+from typing import Callable, Iterator, Optional, Union
 
 import requests
 
@@ -22,6 +23,8 @@ class ApiClient:
         base_url: str = "",
         default_headers: Optional[dict[str, str]] = None,
         timeout: int = 30,
+        session: Optional[requests.Session] = None,
+        clock: Callable[[], float] = time.time,
     ):
         """
         Initialize the API client.
@@ -30,10 +33,16 @@ class ApiClient:
             base_url: Base URL for all requests (optional)
             default_headers: Default headers for all requests
             timeout: Request timeout in seconds
+            session: Session to send requests through (optional); one is created
+                per client otherwise so connections are pooled and kept alive
+            clock: Callable returning the current time in seconds, used to
+                measure response times
         """
         self.base_url = base_url.rstrip("/")
         self.default_headers = default_headers or {}
         self.timeout = timeout
+        self._session = session or requests.Session()
+        self._clock = clock
 
     def _build_url(self, endpoint: str) -> str:
         """Build a full URL from the base URL and endpoint."""
@@ -116,13 +125,13 @@ class ApiClient:
         """
         url = self._build_url(endpoint)
         request_headers = self._merge_headers(headers)
-        start_time = time.time()
+        start_time = self._clock()
 
         try:
-            response = requests.get(
+            response = self._session.get(
                 url, params=params, headers=request_headers, timeout=self.timeout
             )
-            elapsed = time.time() - start_time
+            elapsed = self._clock() - start_time
             payload = params
 
             if response.status_code < StatusCodes.BAD_REQUEST.value:
@@ -134,7 +143,7 @@ class ApiClient:
 
             return response
         except requests.RequestException as e:
-            elapsed = time.time() - start_time
+            elapsed = self._clock() - start_time
             status_code = self._handle_request_exception(e)
             self._log_failure(url, "GET", str(e), params, status_code, elapsed)
             raise requests.RequestException(
@@ -170,17 +179,17 @@ class ApiClient:
             request_headers["Content-Type"] = "application/json"
 
         payload = json_data if json_data is not None else data
-        start_time = time.time()
+        start_time = self._clock()
 
         try:
-            response = requests.post(
+            response = self._session.post(
                 url,
                 data=data,
                 json=json_data,
                 headers=request_headers,
                 timeout=self.timeout,
             )
-            elapsed = time.time() - start_time
+            elapsed = self._clock() - start_time
             payload_dict = payload if isinstance(payload, dict) else None
 
             if response.status_code < StatusCodes.BAD_REQUEST.value:
@@ -197,7 +206,7 @@ class ApiClient:
 
             return response
         except requests.RequestException as e:
-            elapsed = time.time() - start_time
+            elapsed = self._clock() - start_time
             status_code = self._handle_request_exception(e)
             payload_dict = payload if isinstance(payload, dict) else None
             self._log_failure(url, "POST", str(e), payload_dict, status_code, elapsed)
@@ -205,6 +214,73 @@ class ApiClient:
                 f"POST request failed for {url}: {str(e)}"
             ) from e
 
+    def post_stream(
+        self,
+        endpoint: str,
+        json_data: Optional[dict[str, Union[str, int, float, bool, list, dict]]] = None,
+        headers: Optional[dict[str, str]] = None,
+    ) -> Iterator[dict]:
+        """
+        Perform a streaming POST request and yield server-sent event payloads.
+
+        Args:
+            endpoint: Relative or absolute API endpoint
+            json_data: JSON body
+            headers: Optional request-specific headers
+
+        Yields:
+            Decoded JSON payload of each "data:" event
+
+        Raises:
+            requests.RequestException
+        """
+        url = self._build_url(endpoint)
+        request_headers = self._merge_headers(headers)
+
+        if json_data and "Content-Type" not in request_headers:
+            request_headers["Content-Type"] = "application/json"
+
+        start_time = self._clock()
+
+        try:
+            response = self._session.post(
+                url,
+                json=json_data,
+                headers=request_headers,
+                timeout=self.timeout,
+                stream=True,
+            )
+        except requests.RequestException as e:
+            elapsed = self._clock() - start_time
+            status_code = self._handle_request_exception(e)
+            self._log_failure(url, "POST", str(e), json_data, status_code, elapsed)
+            raise requests.RequestException(
+                f"POST stream request failed for {url}: {str(e)}"
+            ) from e
+
+        elapsed = self._clock() - start_time
+        if response.status_code >= StatusCodes.BAD_REQUEST.value:
+            self._log_failure(
+                url, "POST", response.text, json_data, response.status_code, elapsed
+            )
+            raise requests.RequestException(
+                f"POST stream request failed for {url}: {response.status_code}"
+            )
+        self._log_success(url, "POST", response, json_data, elapsed)
+
+        with response:
+            for line in response.iter_lines(decode_unicode=True):
+                if not line or not line.startswith("data:"):
+                    continue
+                event = line[len("data:") :].strip()
+                if event == "[DONE]":
+                    break
+                yield json.loads(event)
+
+    def close(self) -> None:
+        """Close the session and release its pooled connections."""
+        self._session.close()
+
     def set_default_headers(self, headers: dict[str, str]) -> None:
         """Set global default headers for requests."""
         self.default_headers.update(headers)
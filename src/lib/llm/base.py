@@ -1,6 +1,7 @@
 """Abstract Base Class for LLM Strategies"""
 
 from abc import ABC, abstractmethod
+from typing import Iterator
 
 from ...constants.llm import (SYSTEM_PROMPT_CONTEXT, TOOL_SUGGESTION_EXAMPLES,
                               TOOL_SYSTEM_ROLE)
@@ -8,6 +9,22 @@ from ...constants.messages import TOOL_SUGGESTION_FORMAT
 from ...data.schemas.tools.tool import ToolPlan
 from ..api import ApiClient
 
+TOOL_PROMPT_PREFIX = f"""
+        Role:
+        {TOOL_SYSTEM_ROLE}
+
+        Context:
+        {SYSTEM_PROMPT_CONTEXT}
+
+        Response Format: Return ONLY a valid JSON array of tool suggestions in this exact format:
+        {TOOL_SUGGESTION_FORMAT}
+
+        IMPORTANT: When multiple tools are suggested, always place the calculator tool LAST in the array. Calculator tool can take results from other tools as input using 'depends_on' key.
+
+        Examples:
+        {TOOL_SUGGESTION_EXAMPLES}
+"""
+
 
 class LLMStrategy(ABC):
     """Abstract base class for LLM strategies using Strategy Pattern"""
@@ -27,6 +44,20 @@ class LLMStrategy(ABC):
         """
         pass
 
+    def query_stream(self, prompt: str) -> Iterator[str]:
+        """
+        Stream a basic query, yielding text chunks as the LLM produces them.
+
+        Default: yield the full query() response as a single chunk.
+
+        Args:
+            prompt: The user's query
+
+        Yields:
+            str: Chunks of the response text
+        """
+        yield self.query(prompt)
+
     @abstractmethod
     def refine(self, prompt: str) -> ToolPlan:
         """
@@ -43,23 +74,8 @@ class LLMStrategy(ABC):
     def _get_system_prompt(self, prompt: str) -> str:
         """
         Get the system prompt for the LLM.
-        """
-
-        system_prompt = f"""
-        Role:
-        {TOOL_SYSTEM_ROLE}
-
-        Context:
-        {SYSTEM_PROMPT_CONTEXT}
-
-        Response Format: Return ONLY a valid JSON array of tool suggestions in this exact format:
-        {TOOL_SUGGESTION_FORMAT}
-
-        IMPORTANT: When multiple tools are suggested, always place the calculator tool LAST in the array. Calculator tool can take results from other tools as input using 'depends_on' key.
-
-        Examples:
-        {TOOL_SUGGESTION_EXAMPLES}
 
-        Prompt: {prompt}
+        The static instructions are a fixed prefix so provider-side prompt
+        caching can reuse them; only the user prompt is appended at the end.
         """
-        return system_prompt
+        return f"{TOOL_PROMPT_PREFIX}\n        Prompt: {prompt}\n        "
@@ -2,6 +2,7 @@
 
 import re
 from os import getenv
+from typing import Iterator
 
 from ...constants.llm import GEMINI_API_URL, GEMINI_MODEL
 from ...data.schemas.tools.tool import ToolPlan
@@ -31,6 +32,19 @@ class GeminiStrategy(LLMStrategy):
         except Exception as e:
             raise GeminiError(f"Error querying Gemini: {str(e)}")
 
+    def query_stream(self, prompt: str) -> Iterator[str]:
+        try:
+            data = {"contents": [{"parts": [{"text": prompt}]}]}
+            for event in self.apiClient.post_stream(
+                f"/{GEMINI_MODEL}:streamGenerateContent?alt=sse", json_data=data
+            ):
+                for candidate in event.get("candidates", [])[:1]:
+                    for part in candidate.get("content", {}).get("parts", []):
+                        if part.get("text"):
+                            yield part["text"]
+        except Exception as e:
+            raise GeminiError(f"Error streaming from Gemini: {str(e)}")
+
     def refine(self, prompt: str) -> ToolPlan:
         data = {
             "contents": [{"parts": [{"text": self._get_system_prompt(prompt=prompt)}]}]
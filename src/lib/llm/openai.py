@@ -2,7 +2,7 @@
 
 import re
 from os import getenv
-from typing import Optional
+from typing import Iterator, Optional
 
 from ...constants.llm import OPENAI_API_URL, OPENAI_MODEL
 from ...data.schemas.tools.tool import ToolPlan
@@ -30,6 +30,26 @@ class OpenAIStrategy(LLMStrategy):
         except Exception as e:
             raise OpenAIError(f"Error querying OpenAI: {str(e)}")
 
+    def query_stream(self, prompt: str) -> Iterator[str]:
+        data = {
+            "model": OPENAI_MODEL,
+            "input": prompt,
+            "temperature": 0.7,
+            "stream": True,
+        }
+
+        try:
+            for event in self.apiClient.post_stream("/responses", json_data=data):
+                event_type = event.get("type")
+                if event_type == "response.output_text.delta":
+                    yield event.get("delta", "")
+                elif event_type in ("error", "response.failed"):
+                    raise OpenAIError(f"OpenAI stream failed: {event}")
+        except OpenAIError:
+            raise
+        except Exception as e:
+            raise OpenAIError(f"Error streaming from OpenAI: {str(e)}")
+
     def refine(self, prompt: str) -> ToolPlan:
         data = {"model": OPENAI_MODEL, "input": self._get_system_prompt(prompt=prompt)}
 
@@ -2,7 +2,8 @@
 Agent-specific logger for tracking high-level agent operations and workflows.
 """
 
-from typing import Optional
+import logging
+from typing import Optional, Sequence
 
 from ...data.schemas.logging.metrics import AgentMetrics
 from .base import BaseLogger
@@ -85,11 +86,14 @@ class AgentLogger(BaseLogger):
 
         self.error(f"WORKFLOW_ERROR: {step} - {error}")
 
-    def log_tool_plan(self, tools: list[dict[str, str | list[str]]]) -> None:
+    def log_tool_plan(self, tools: Sequence[dict[str, str | list[str]]]) -> None:
         """Log the planned tool execution sequence."""
         tool_names = [str(tool.get("tool", "unknown")) for tool in tools]
         self.info(f"TOOL_PLAN: Executing tools in sequence: {' -> '.join(tool_names)}")
 
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+
         for i, tool in enumerate(tools):
             dependencies = tool.get("depends_on", [])
             dep_info = f" (depends on: {dependencies})" if dependencies else ""
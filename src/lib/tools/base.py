@@ -2,6 +2,8 @@
 
 from abc import ABC, abstractmethod
 
+from ...data.schemas.tools.tool_response import ToolResponse
+
 
 class Action(ABC):
     """Abstract base class for tool actions using Command Pattern"""
@@ -10,6 +12,10 @@ class Action(ABC):
     def execute(self, args: dict) -> str:
         pass
 
+    def close(self) -> None:
+        """Release resources held by the tool. Default: nothing to release."""
+        pass
+
 
 class ToolInvokerBase(ABC):
     """Abstract invoker base class for executing tools using Command Pattern"""
@@ -23,6 +29,10 @@ class ToolInvokerBase(ABC):
         pass
 
     @abstractmethod
-    def execute(self, args: dict) -> str:
+    def execute(self, args: dict) -> ToolResponse:
         """Execute the current tool with logging."""
         pass
+
+    def close(self) -> None:
+        """Release resources held by the invoker's tools. Default: nothing."""
+        pass
@@ -1,9 +1,21 @@
 """Calculator Tool"""
 
+import functools
+import re
+
 from ..errors.tools.calculator import (BracketMismatchError, EvaluationError,
                                        ExpressionError, TokenizationError)
 from .base import Action
 
+# One left-to-right scan splits an expression into numbers, operators and brackets;
+# whitespace is skipped and any other character is reported.
+_TOKEN_RE = re.compile(
+    r"(?P<token>[\d.]+|[-+*/%^(){}\[\]])|(?P<space>\s+)|(?P<invalid>.)", re.DOTALL
+)
+_PRECEDENCE = {"+": 1, "-": 1, "*": 2, "/": 2, "%": 2, "^": 3}
+_OPENING = {"(": ")", "{": "}", "[": "]"}
+_CLOSING = {")": "(", "}": "{", "]": "["}
+
 
 class Calculator(Action):
     """Calculator tool using Shunting Yard algorithm."""
@@ -19,30 +31,29 @@ class Calculator(Action):
         if not expr.strip():
             raise ExpressionError("Expression cannot be empty")
 
-        tokens = self._tokenize(expr)
-        postfix = self._to_postfix(tokens)
-        result = self._eval_postfix(postfix)
+        return self._evaluate(expr.strip())
+
+    @classmethod
+    @functools.lru_cache(maxsize=512)
+    def _evaluate(cls, expr: str) -> str:
+        """
+        Evaluate an expression. Evaluation is pure and a Calculator is built per
+        tool call, so results are cached on the class and shared across instances.
+        """
+        calculator = cls()
+        tokens = calculator._tokenize(expr)
+        postfix = calculator._to_postfix(tokens)
+        result = calculator._eval_postfix(postfix)
         return str(result)
 
     def _tokenize(self, expr: str) -> list[str]:
         """Tokenize mathematical expression into numbers and operators."""
         tokens = []
-        num = ""
-        for ch in expr:
-            if ch.isdigit() or ch == ".":
-                num += ch
-            else:
-                if num:
-                    tokens.append(num)
-                    num = ""
-                if ch in "+-*/%^(){}[]":
-                    tokens.append(ch)
-                elif ch.isspace():
-                    continue
-                else:
-                    raise TokenizationError(f"Invalid character: '{ch}'")
-        if num:
-            tokens.append(num)
+        for match in _TOKEN_RE.finditer(expr):
+            if match.lastgroup == "invalid":
+                raise TokenizationError(f"Invalid character: '{match.group()}'")
+            if match.lastgroup == "token":
+                tokens.append(match.group())
         return tokens
 
     def _is_number(self, token: str) -> bool:
@@ -96,24 +107,20 @@ class Calculator(Action):
         output = []
         stack: list[str] = []
 
-        precedence = {"+": 1, "-": 1, "*": 2, "/": 2, "%": 2, "^": 3}
-        opening = {"(": ")", "{": "}", "[": "]"}
-        closing = {")": "(", "}": "{", "]": "["}
-
         for token in tokens:
             if self._is_number(token):
                 output.append(token)
-            elif token in precedence:
-                self._handle_operator(token, stack, output, precedence)
-            elif token in opening:
+            elif token in _PRECEDENCE:
+                self._handle_operator(token, stack, output, _PRECEDENCE)
+            elif token in _OPENING:
                 stack.append(token)
-            elif token in closing:
-                self._handle_closing_bracket(token, stack, output, closing)
+            elif token in _CLOSING:
+                self._handle_closing_bracket(token, stack, output, _CLOSING)
             else:
                 raise TokenizationError(f"Unknown token: '{token}'")
 
         while stack:
-            if stack[-1] in opening:
+            if stack[-1] in _OPENING:
                 raise BracketMismatchError("Unclosed opening bracket")
             output.append(stack.pop())
 
@@ -17,6 +17,10 @@ class CurrencyConverter(Action):
     def __init__(self):
         self.apiClient = ApiClient(base_url=CURRENCY_API_URL)
 
+    def close(self) -> None:
+        """Close the API client's session."""
+        self.apiClient.close()
+
     def execute(self, args: dict) -> str:
         """
         Execute currency conversion.
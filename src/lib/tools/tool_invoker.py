@@ -4,7 +4,7 @@ import time
 from typing import Union
 
 from ...constants.tools import Tool
-from ..errors.tools.invoker import InvokerError
+from ...data.schemas.tools.tool_response import ToolResponse
 from ..loggers import tool_logger
 from .base import Action, ToolInvokerBase
 from .calculator import Calculator
@@ -16,26 +16,46 @@ from .weather import Weather
 class ToolInvoker(ToolInvokerBase):
     """Invoker class for executing tools using Command Pattern"""
 
+    _TOOL_CLS: dict[str, type[Action]] = {
+        Tool.CALCULATOR.value: Calculator,
+        Tool.WEATHER.value: Weather,
+        Tool.KNOWLEDGE_BASE.value: KnowledgeBase,
+        Tool.CURRENCY_CONVERTER.value: CurrencyConverter,
+    }
+
     __action: Action
     __current_tool: str
 
+    def __init__(self):
+        # Tools are built once per invoker so their API clients keep one pooled
+        # session each across calls; close() releases them.
+        self.__tools: dict[str, Action] = {}
+
     def set_action(self, tool_type: str) -> None:
         """Set the action/tool to be executed."""
+        tool_cls = self._TOOL_CLS.get(tool_type)
+        if tool_cls is None:
+            raise ValueError(f"Unknown tool type: {tool_type}")
+
         self.__current_tool = tool_type
+        action = self.__tools.get(tool_type)
+        if action is None:
+            action = self.__tools[tool_type] = tool_cls()
+        self.__action = action
 
-        if tool_type == Tool.CALCULATOR.value:
-            self.__action = Calculator()
-        elif tool_type == Tool.WEATHER.value:
-            self.__action = Weather()
-        elif tool_type == Tool.KNOWLEDGE_BASE.value:
-            self.__action = KnowledgeBase()
-        elif tool_type == Tool.CURRENCY_CONVERTER.value:
-            self.__action = CurrencyConverter()
-        else:
-            raise ValueError(f"Unknown tool type: {tool_type}")
+    def close(self) -> None:
+        """Close the tools built by this invoker."""
+        for action in self.__tools.values():
+            action.close()
+        self.__tools.clear()
 
-    def execute(self, args: dict[str, Union[str, float, int]]) -> str:
-        """Execute the current tool with logging."""
+    def execute(self, args: dict[str, Union[str, float, int]]) -> ToolResponse:
+        """
+        Execute the current tool with logging.
+
+        Tool failures are returned as an unsuccessful ToolResponse rather than
+        raised, so the agent does not need exception handling around each tool.
+        """
         if not hasattr(self, "_ToolInvoker__action"):
             raise RuntimeError("No tool action set. Call set_action() first.")
 
@@ -44,14 +64,19 @@ class ToolInvoker(ToolInvokerBase):
         start_time = time.time()
         try:
             result = self.__action.execute(args)
-            execution_time = time.time() - start_time
-
-            tool_logger.log_tool_success(self.__current_tool, result, execution_time)
-            return result
-
         except Exception as e:
-            execution_time = time.time() - start_time
             error_type = type(e).__name__
 
             tool_logger.log_tool_failure(self.__current_tool, str(e), error_type)
-            raise InvokerError(f"Tool execution failed: {str(e)}") from e
+            return ToolResponse(
+                tool=self.__current_tool,
+                args=args,
+                success=False,
+                error=f"Tool execution failed: {str(e)}",
+            )
+
+        execution_time = time.time() - start_time
+        tool_logger.log_tool_success(self.__current_tool, result, execution_time)
+        return ToolResponse(
+            tool=self.__current_tool, args=args, success=True, result=result
+        )
@@ -15,12 +15,16 @@ class Weather(Action):
     """Weather tool using OpenWeatherMap API."""
 
     def __init__(self):
-        self.apiClient = ApiClient(base_url=WEATHER_API_URL)
         self.api_key = getenv("WEATHER_API_KEY")
         if not self.api_key:
             raise WeatherConfigurationError(
                 "WEATHER_API_KEY environment variable is required"
             )
+        self.apiClient = ApiClient(base_url=WEATHER_API_URL)
+
+    def close(self) -> None:
+        """Close the API client's session."""
+        self.apiClient.close()
 
     def execute(self, args: dict) -> str:
         """
@@ -1,29 +1,35 @@
-"""Tests for Gemini Agent"""
+"""Tests for the Gemini and OpenAI Agents"""
 
 import os
 from unittest.mock import patch
 
 import pytest
-from dotenv import load_dotenv
 
 from src.constants.messages import FAILED_AGENT_MESSAGE
 from src.data.schemas.tools.tool import ToolPlan, ToolSuggestion
 from src.data.schemas.tools.tool_response import ToolResponse
 from src.lib.agents.gemini import GeminiAgent
+from src.lib.agents.openai import OpenAIAgent
 from src.lib.llm.gemini import GeminiStrategy
+from src.lib.llm.openai import OpenAIStrategy
 from src.lib.tools.tool_invoker import ToolInvoker
 
+AGENT_CASES = [
+    pytest.param((GeminiAgent, GeminiStrategy, "GEMINI_API_KEY"), id="gemini"),
+    pytest.param((OpenAIAgent, OpenAIStrategy, "OPENAI_API_KEY"), id="openai"),
+]
 
-@pytest.mark.usefixtures("gemini_agent_fixture")
-class TestGeminiAgent:
-    """Test suite for Gemini Agent."""
 
-    @pytest.fixture(autouse=True)
-    def gemini_agent_fixture(self):
-        """Fixture that provides a Gemini agent instance for each test."""
-        load_dotenv()
-        with patch.dict(os.environ, {"GEMINI_API_KEY": "test-api-key"}):
-            self.agent = GeminiAgent()
+@pytest.mark.usefixtures("agent_fixture")
+class TestAgentBase:
+    """Test suite shared by the Gemini and OpenAI Agents."""
+
+    @pytest.fixture(autouse=True, params=AGENT_CASES)
+    def agent_fixture(self, request):
+        """Fixture that provides each agent instance in turn for each test."""
+        self.agent_class, self.strategy_class, self.api_key_env = request.param
+        with patch.dict(os.environ, {self.api_key_env: "test-api-key"}):
+            self.agent = self.agent_class()
 
     def _create_mock_tool_plan(self, suggestions=None):
         """Helper to create a mock tool plan."""
@@ -46,10 +52,10 @@ class TestGeminiAgent:
         )
 
     def test_initialization(self):
-        """Test Gemini agent initializes correctly."""
-        with patch.dict(os.environ, {"GEMINI_API_KEY": "test-key"}):
-            agent = GeminiAgent()
-            assert isinstance(agent.llm_strategy, GeminiStrategy)
+        """Test agent initializes with its LLM strategy and tool invoker."""
+        with patch.dict(os.environ, {self.api_key_env: "test-key"}):
+            agent = self.agent_class()
+            assert isinstance(agent.llm_strategy, self.strategy_class)
             assert isinstance(agent.tool_invoker, ToolInvoker)
 
     def test_successful_simple_query(self):
@@ -63,7 +69,9 @@ class TestGeminiAgent:
         ), patch.object(
             self.agent.tool_invoker, "set_action"
         ), patch.object(
-            self.agent.tool_invoker, "execute", return_value="4"
+            self.agent.tool_invoker,
+            "execute",
+            return_value=self._create_mock_tool_response(),
         ):
 
             result = self.agent.answer("What is 2+2?")
@@ -86,7 +94,12 @@ class TestGeminiAgent:
         ), patch.object(
             self.agent.tool_invoker, "set_action"
         ), patch.object(
-            self.agent.tool_invoker, "execute", side_effect=["18°C", "15°C"]
+            self.agent.tool_invoker,
+            "execute",
+            side_effect=[
+                self._create_mock_tool_response("weather", "18°C"),
+                self._create_mock_tool_response("weather", "15°C"),
+            ],
         ):
 
             result = self.agent.answer("What's the weather in Paris and London?")
@@ -114,7 +127,9 @@ class TestGeminiAgent:
         ), patch.object(
             self.agent.tool_invoker,
             "execute",
-            return_value="Ada Lovelace was a 19th-century mathematician",
+            return_value=self._create_mock_tool_response(
+                "knowledge_base", "Ada Lovelace was a 19th-century mathematician"
+            ),
         ):
 
             result = self.agent.answer("Who is Ada Lovelace?")
@@ -140,7 +155,9 @@ class TestGeminiAgent:
         ), patch.object(
             self.agent.tool_invoker, "set_action"
         ), patch.object(
-            self.agent.tool_invoker, "execute", return_value="85.23"
+            self.agent.tool_invoker,
+            "execute",
+            return_value=self._create_mock_tool_response("currency_converter", "85.23"),
         ):
 
             result = self.agent.answer("Convert 100 USD to EUR")
@@ -159,7 +176,11 @@ class TestGeminiAgent:
         ), patch.object(
             self.agent.tool_invoker, "set_action"
         ), patch.object(
-            self.agent.tool_invoker, "execute", side_effect=Exception("Tool error")
+            self.agent.tool_invoker,
+            "execute",
+            return_value=self._create_mock_tool_response(
+                result=None, success=False, error="Tool error"
+            ),
         ):
 
             result = self.agent.answer("What is 2+2?")
@@ -185,7 +206,9 @@ class TestGeminiAgent:
         ), patch.object(
             self.agent.tool_invoker, "set_action"
         ), patch.object(
-            self.agent.tool_invoker, "execute", return_value="4"
+            self.agent.tool_invoker,
+            "execute",
+            return_value=self._create_mock_tool_response(),
         ):
 
             result = self.agent.answer("What is 2+2?")
@@ -228,7 +251,13 @@ class TestGeminiAgent:
         ), patch.object(
             self.agent.tool_invoker,
             "execute",
-            side_effect=["15°C", "20°C", "Weather patterns info"],
+            side_effect=[
+                self._create_mock_tool_response("weather", "15°C"),
+                self._create_mock_tool_response("weather", "20°C"),
+                self._create_mock_tool_response(
+                    "knowledge_base", "Weather patterns info"
+                ),
+            ],
         ):
 
             result = self.agent.answer(
@@ -275,7 +304,12 @@ class TestGeminiAgent:
         ), patch.object(
             self.agent.tool_invoker, "set_action", side_effect=mock_set_action
         ), patch.object(
-            self.agent.tool_invoker, "execute", side_effect=["18°C", "Paris info"]
+            self.agent.tool_invoker,
+            "execute",
+            side_effect=[
+                self._create_mock_tool_response("weather", "18°C"),
+                self._create_mock_tool_response("knowledge_base", "Paris info"),
+            ],
         ):
 
             self.agent.answer("Tell me about Paris weather and facts")
@@ -283,6 +317,29 @@ class TestGeminiAgent:
             assert "weather" in execution_order
             assert "knowledge_base" in execution_order
 
+    def test_calculator_replan_summarises_each_response(self):
+        """Test that the re-plan prompt lists each earlier response in turn."""
+        self.agent.tool_plan = []
+        responses = [
+            self._create_mock_tool_response("weather", "18°C"),
+            self._create_mock_tool_response("weather", "15°C"),
+        ]
+
+        with patch.object(
+            self.agent.llm_strategy,
+            "refine",
+            return_value=self._create_mock_tool_plan(),
+        ) as mock_refine:
+            self.agent._evaluate_calculator_dependencies(responses)
+
+        mock_refine.assert_called_once_with(
+            f"Based on these results: {responses[0]}; {responses[1]}."
+            " What calculations should be performed?"
+        )
+        assert self.agent.tool_plan == [
+            {"tool": "calculator", "args": {"expr": "2+2"}, "depends_on": []}
+        ]
+
     def test_error_handling_with_partial_success(self):
         """Test error handling when some tools succeed and others fail."""
         suggestions = [
@@ -293,9 +350,10 @@ class TestGeminiAgent:
 
         def mock_execute(args):
             if "city" in args:
-                return "18°C"
-            else:
-                raise Exception("Invalid expression")
+                return self._create_mock_tool_response("weather", "18°C")
+            return self._create_mock_tool_response(
+                result=None, success=False, error="Invalid expression"
+            )
 
         with patch.object(
             self.agent.llm_strategy, "refine", return_value=mock_tool_plan
@@ -311,6 +369,23 @@ class TestGeminiAgent:
             assert isinstance(result, str)
             assert len(result) > 0
 
+    def test_error_handling_preserves_original_message(self):
+        """Test that error handling preserves original error information."""
+        original_error = "Specific API error"
+
+        from src.lib.loggers import agent_logger
+
+        with patch.object(
+            self.agent.llm_strategy, "refine", side_effect=Exception(original_error)
+        ), patch.object(agent_logger, "log_query_failure") as mock_log:
+
+            result = self.agent.answer("test query")
+            assert result == FAILED_AGENT_MESSAGE
+
+            mock_log.assert_called_once()
+            args = mock_log.call_args[0]
+            assert original_error in args[1]
+
     def test_successful_logging(self):
         """Test that successful queries are logged correctly."""
         mock_tool_plan = self._create_mock_tool_plan()
@@ -324,7 +399,9 @@ class TestGeminiAgent:
         ), patch.object(
             self.agent.tool_invoker, "set_action"
         ), patch.object(
-            self.agent.tool_invoker, "execute", return_value="4"
+            self.agent.tool_invoker,
+            "execute",
+            return_value=self._create_mock_tool_response(),
         ), patch.object(
             agent_logger, "log_query_success"
         ) as mock_log:
@@ -368,7 +445,9 @@ class TestGeminiAgent:
         ), patch.object(
             self.agent.tool_invoker, "set_action"
         ), patch.object(
-            self.agent.tool_invoker, "execute", return_value="4"
+            self.agent.tool_invoker,
+            "execute",
+            return_value=self._create_mock_tool_response(),
         ), patch.object(
             agent_logger, "log_tool_plan"
         ) as mock_log:
@@ -377,8 +456,9 @@ class TestGeminiAgent:
 
             mock_log.assert_called_once()
             logged_plan = mock_log.call_args[0][0]
-            assert isinstance(logged_plan, list)
+            assert isinstance(logged_plan, tuple)
             assert len(logged_plan) > 0
+            assert logged_plan is not self.agent.tool_plan
 
     def test_response_fusion_with_multiple_results(self):
         """Test response fusion when multiple tools return results."""
@@ -401,7 +481,12 @@ class TestGeminiAgent:
         ), patch.object(
             self.agent.tool_invoker,
             "execute",
-            side_effect=["18°C", "Paris is the capital of France"],
+            side_effect=[
+                self._create_mock_tool_response("weather", "18°C"),
+                self._create_mock_tool_response(
+                    "knowledge_base", "Paris is the capital of France"
+                ),
+            ],
         ):
 
             result = self.agent.answer("Tell me about Paris weather and facts")
@@ -422,7 +507,9 @@ class TestGeminiAgent:
         ), patch.object(
             self.agent.tool_invoker, "set_action"
         ), patch.object(
-            self.agent.tool_invoker, "execute", return_value="4"
+            self.agent.tool_invoker,
+            "execute",
+            return_value=self._create_mock_tool_response(),
         ), patch.object(
             agent_logger, "log_query_start"
         ) as mock_log:
@@ -432,3 +519,85 @@ class TestGeminiAgent:
             mock_log.assert_called_once()
             args = mock_log.call_args[0]
             assert args[0] == "What is 2+2?"
+
+    def test_answer_stream_yields_chunks(self):
+        """Test that the streaming answer yields fused chunks as they arrive."""
+        mock_tool_plan = self._create_mock_tool_plan()
+
+        with patch.object(
+            self.agent.llm_strategy, "refine", return_value=mock_tool_plan
+        ), patch.object(
+            self.agent.llm_strategy,
+            "query_stream",
+            return_value=iter(["The answer", " is 4"]),
+        ), patch.object(
+            self.agent.tool_invoker, "set_action"
+        ), patch.object(
+            self.agent.tool_invoker,
+            "execute",
+            return_value=self._create_mock_tool_response(),
+        ):
+
+            chunks = list(self.agent.answer_stream("What is 2+2?"))
+
+            assert chunks == ["The answer", " is 4"]
+
+    def test_answer_stream_strips_like_answer(self):
+        """Test that the joined stream is stripped the same way answer() is."""
+        mock_tool_plan = self._create_mock_tool_plan()
+
+        with patch.object(
+            self.agent.llm_strategy, "refine", return_value=mock_tool_plan
+        ), patch.object(
+            self.agent.llm_strategy,
+            "query_stream",
+            return_value=iter(["\n ", " The answer ", "\n", "is 4", " \n"]),
+        ), patch.object(
+            self.agent.tool_invoker, "set_action"
+        ), patch.object(
+            self.agent.tool_invoker,
+            "execute",
+            return_value=self._create_mock_tool_response(),
+        ):
+
+            chunks = list(self.agent.answer_stream("What is 2+2?"))
+
+            assert "".join(chunks) == "The answer \nis 4"
+
+    def test_answer_stream_with_mid_stream_failure(self):
+        """Test that a stream failing partway ends with the failure message."""
+        from src.lib.loggers import agent_logger
+
+        mock_tool_plan = self._create_mock_tool_plan()
+
+        def failing_stream(_prompt):
+            yield "The answer"
+            raise Exception("Connection reset")
+
+        with patch.object(
+            self.agent.llm_strategy, "refine", return_value=mock_tool_plan
+        ), patch.object(
+            self.agent.llm_strategy, "query_stream", side_effect=failing_stream
+        ), patch.object(
+            self.agent.tool_invoker, "set_action"
+        ), patch.object(
+            self.agent.tool_invoker,
+            "execute",
+            return_value=self._create_mock_tool_response(),
+        ), patch.object(
+            agent_logger, "log_query_failure"
+        ) as mock_log:
+
+            chunks = list(self.agent.answer_stream("What is 2+2?"))
+
+            assert chunks == ["The answer", f"\n{FAILED_AGENT_MESSAGE}"]
+            assert mock_log.call_args[0][1] == "Connection reset"
+
+    def test_answer_stream_with_llm_refine_failure(self):
+        """Test that the streaming answer yields the failure message on error."""
+        with patch.object(
+            self.agent.llm_strategy, "refine", side_effect=Exception("LLM Error")
+        ):
+            chunks = list(self.agent.answer_stream("What is 2+2?"))
+
+            assert chunks == [FAILED_AGENT_MESSAGE]
@@ -0,0 +1,75 @@
+"""Shared fixtures for LLM strategy tests."""
+
+import functools
+import os
+from unittest.mock import create_autospec, patch
+
+import pytest
+
+from src.lib.api import ApiClient
+from src.lib.llm.gemini import GeminiStrategy
+from src.lib.llm.openai import OpenAIStrategy
+
+
+@functools.lru_cache(maxsize=8)
+def _build_strategy(strategy_cls, api_key_env, api_key):
+    """Build a strategy with the given API key, or with the key unset if None."""
+    with patch.dict(os.environ):
+        if api_key is None:
+            os.environ.pop(api_key_env, None)
+        else:
+            os.environ[api_key_env] = api_key
+        return strategy_cls()
+
+
+@pytest.fixture(scope="session")
+def make_strategy():
+    """Provide a cached strategy factory for tests that only inspect configuration."""
+    return _build_strategy
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _llm_env():
+    """Set fake provider keys per module and undo them so smoke tests keep real keys."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("GEMINI_API_KEY", "test-api-key")
+        mp.setenv("OPENAI_API_KEY", "test-api-key")
+        yield
+
+
+@pytest.fixture(scope="session")
+def _apiclient_mock_template():
+    """Autospec the ApiClient once per session; introspection is the slow part."""
+    return create_autospec(ApiClient, instance=True)
+
+
+@pytest.fixture
+def apiclient_mock(_apiclient_mock_template):
+    """Provide the shared ApiClient mock with calls and configured returns cleared."""
+    _apiclient_mock_template.reset_mock(return_value=True, side_effect=True)
+    return _apiclient_mock_template
+
+
+@pytest.fixture
+def failing_post(apiclient_mock):
+    """Make the shared ApiClient mock's post() raise as if the API call failed."""
+    apiclient_mock.post.side_effect = Exception("API Error")
+    return apiclient_mock.post
+
+
+@pytest.fixture(scope="session")
+def gemini_strategy(_apiclient_mock_template):
+    """Build one Gemini strategy per session, wired to the shared ApiClient mock."""
+    with patch.dict(os.environ, {"GEMINI_API_KEY": "test-api-key"}):
+        strategy = GeminiStrategy()
+    strategy.apiClient = _apiclient_mock_template
+    return strategy
+
+
+@pytest.fixture(scope="session")
+def openai_strategy(_apiclient_mock_template):
+    """Build one OpenAI strategy per session, wired to the shared ApiClient mock."""
+    with patch.dict(os.environ, {"OPENAI_API_KEY": "test-api-key"}):
+        strategy = OpenAIStrategy()
+    strategy.apiClient = _apiclient_mock_template
+    return strategy
@@ -2,43 +2,59 @@
 
 import pytest
 
-from src.data.schemas.tools.tool import ToolPlan
+from src.data.schemas.tools.tool import ToolPlan, ToolSuggestion
 from tests.utils.stubs.agent import AgentStub
-from tests.utils.stubs.llm import StubLLMStrategy
+from tests.utils.stubs.llm import StubLLMStrategy, safe_eval
+from tests.utils.stubs.tools.invoker import StubToolInvoker
+
+pytestmark = pytest.mark.xdist_group("llm_mocked")
 
 
 @pytest.mark.usefixtures("llm_fixture", "agent_fixture")
 class TestLLMStub:
     """Test suite for LLM Stub and Agent tool execution."""
 
-    @pytest.fixture(autouse=True)
-    def llm_fixture(self):
-        """Fixture to provide an LLM stub instance."""
-        self.llm = StubLLMStrategy()
+    @pytest.fixture(scope="class", autouse=True)
+    def llm_fixture(self, request):
+        """Fixture to share one LLM stub instance across the class."""
+        request.cls.llm = StubLLMStrategy()
 
-    @pytest.fixture(autouse=True)
-    def agent_fixture(self):
-        """Fixture to provide an Agent stub instance."""
-        self.agent = AgentStub()
+    @pytest.fixture(scope="class", autouse=True)
+    def agent_fixture(self, request):
+        """Fixture to share one Agent stub instance across the class."""
+        request.cls.agent = AgentStub()
 
-    def test_refine_calculator(self):
-        """Test refining a calculator expression into a tool plan."""
-        plan = self.llm.refine("2 + 3 * 4")
+    @pytest.mark.parametrize(
+        "prompt, expected_tool, expected_key, expected_val",
+        [
+            ("2 + 3 * 4", "calculator", "expr", "2 + 3 * 4"),
+            ("Tell me the weather in Dhaka", "weather", "city", "Dhaka"),
+            ("Who is Ada Lovelace?", "knowledge_base", "query", "ada lovelace"),
+        ],
+        ids=["calculator", "weather", "knowledge_base"],
+    )
+    def test_refine(self, prompt, expected_tool, expected_key, expected_val):
+        """Test refining a prompt into a single-tool plan."""
+        plan = self.llm.refine(prompt)
         assert isinstance(plan, ToolPlan)
-        assert plan.suggestions[0].tool == "calculator"
-        assert plan.suggestions[0].args["expr"] == "2 + 3 * 4"
-
-    def test_refine_weather(self):
-        """Test refining a weather query into a tool plan."""
-        plan = self.llm.refine("Tell me the weather in Dhaka")
-        assert plan.suggestions[0].tool == "weather"
-        assert plan.suggestions[0].args["city"] == "Dhaka"
+        assert plan.suggestions[0].tool == expected_tool
+        assert plan.suggestions[0].args[expected_key] == expected_val
 
-    def test_refine_knowledge_base(self):
-        """Test refining a knowledge base query."""
-        plan = self.llm.refine("Who is Ada Lovelace?")
-        assert plan.suggestions[0].tool == "knowledge_base"
-        assert "ada lovelace" in plan.suggestions[0].args["query"]
+    @pytest.mark.parametrize(
+        "expr, expected",
+        [
+            ("(12.5 / 100) * 243", 30.375),
+            ("sqrt(16) + pow(2, 3)", 12.0),
+            ("-2 ** 2", -4),
+            ("paris_temp + 5", None),
+            ("__import__('os')", None),
+            ("1 / 0", None),
+        ],
+        ids=["percentage", "functions", "unary", "placeholder", "call", "zero"],
+    )
+    def test_safe_eval(self, expr, expected):
+        """Test the stub's restricted arithmetic evaluator."""
+        assert safe_eval(expr) == expected
 
     def test_refine_currency(self):
         """Test refining a currency conversion request."""
@@ -50,22 +66,65 @@ class TestLLMStub:
         """Test agent execution of a calculator tool plan."""
         plan = self.llm.refine("10 + 20")
         responses = self.agent.execute_tools(plan)
-        calc = [r for r in responses if r["tool"] == "calculator"]
+        calc = [r for r in responses if r.tool == "calculator"]
         assert calc
-        assert calc[0]["success"] is True
+        assert calc[0].success is True
 
     def test_agent_execute_tools_weather(self):
         """Test agent execution of a weather tool plan."""
         plan = self.llm.refine("Weather in London")
         responses = self.agent.execute_tools(plan)
-        weather = [r for r in responses if r["tool"] == "weather"]
+        weather = [r for r in responses if r.tool == "weather"]
         assert weather
-        assert "London" in weather[0]["args"]["city"]
+        assert "London" in weather[0].args["city"]
 
     def test_agent_execute_dependent_calculator(self):
         """Test agent execution of dependent calculator plan with weather."""
         plan = self.llm.refine("add 5 to the average temperature in Paris and London")
         responses = self.agent.execute_tools(plan)
-        calc = [r for r in responses if r["tool"] == "calculator"]
+        calc = [r for r in responses if r.tool == "calculator"]
         assert calc
-        assert calc[0]["success"]
+        assert calc[0].success
+
+    @pytest.mark.parametrize(
+        "expr, expected",
+        [
+            ("(Paris_Temp + london_temp) / 2", "(18.0 + 17.0) / 2"),
+            ("paris_temp_max - paris_temp", "paris_temp_max - 18.0"),
+            ("tokyo_temp + 1", "tokyo_temp + 1"),
+        ],
+        ids=["case_insensitive", "word_boundary", "unknown_city"],
+    )
+    def test_substitute_context(self, expr, expected):
+        """Test that only whole, known placeholders are replaced."""
+        context = {"paris_temp": 18.0, "london_temp": 17.0}
+        assert AgentStub._substitute_context(expr, context) == expected
+
+    def test_agent_execute_cyclic_plan_runs_each_tool_once(self):
+        """Test that a cyclic dependency plan still runs every tool exactly once."""
+        first = ToolSuggestion(
+            tool="calculator", args={"expr": "1 + 1"}, depends_on=["calculator"]
+        )
+        plan = ToolPlan(suggestions=[first, first.model_copy(deep=True)])
+        responses = self.agent.execute_tools(plan)
+        assert len(responses) == 2
+        assert all(r.success for r in responses)
+
+    def test_invoker_reuses_tool_instances(self):
+        """Test that the stub invoker builds each tool once and rejects unknown ones."""
+        invoker = StubToolInvoker()
+        invoker.set_action("calculator")
+        first = invoker._action
+        invoker.set_action("weather")
+        invoker.set_action("calculator")
+        assert invoker._action is first
+        with pytest.raises(ValueError, match="Unknown tool type"):
+            invoker.set_action("unknown")
+
+    def test_invoker_returns_failed_response(self):
+        """Test that a failing tool comes back as an unsuccessful ToolResponse."""
+        invoker = StubToolInvoker()
+        invoker.set_action("calculator")
+        response = invoker.execute({"expr": ""})
+        assert response.success is False
+        assert response.error == "Tool execution failed: No expression provided"
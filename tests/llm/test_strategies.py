@@ -0,0 +1,145 @@
+"""Shared tests for the Gemini and OpenAI LLM Strategies"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.constants.llm import GEMINI_API_URL, OPENAI_API_URL
+from src.data.schemas.tools.tool import ToolPlan
+from src.lib.errors.llms.gemini import GeminiError
+from src.lib.errors.llms.openai import OpenAIError
+from src.lib.llm.gemini import GeminiStrategy
+from src.lib.llm.openai import OpenAIStrategy
+from tests.utils.constants.llm import PROMPT_RE, gemini_payload, openai_payload
+from tests.utils.stubs.response import StubResponse
+
+pytestmark = pytest.mark.xdist_group("llm_mocked")
+
+LLM_CASES = [
+    pytest.param(
+        SimpleNamespace(
+            name="gemini",
+            provider="Gemini",
+            strategy_cls=GeminiStrategy,
+            error_cls=GeminiError,
+            payload=gemini_payload,
+            empty_payload={"candidates": []},
+            api_url=GEMINI_API_URL,
+            api_key_env="GEMINI_API_KEY",
+        ),
+        id="gemini",
+    ),
+    pytest.param(
+        SimpleNamespace(
+            name="openai",
+            provider="OpenAI",
+            strategy_cls=OpenAIStrategy,
+            error_cls=OpenAIError,
+            payload=openai_payload,
+            empty_payload={"output": []},
+            api_url=OPENAI_API_URL,
+            api_key_env="OPENAI_API_KEY",
+        ),
+        id="openai",
+    ),
+]
+
+
+@pytest.fixture(params=LLM_CASES)
+def llm_case(request, apiclient_mock):
+    """Fixture that provides each strategy, with its response shape and error class."""
+    strategy = request.getfixturevalue(f"{request.param.name}_strategy")
+    return SimpleNamespace(**vars(request.param), strategy=strategy)
+
+
+class TestLLMStrategies:
+    """Test suite shared by the Gemini and OpenAI LLM Strategies."""
+
+    def test_initialization_without_api_key(self, llm_case, make_strategy):
+        """Test strategy initializes without an API key."""
+        strategy = make_strategy(llm_case.strategy_cls, llm_case.api_key_env, None)
+        assert strategy.apiClient.base_url == llm_case.api_url
+
+    def test_content_type_header(self, llm_case, make_strategy):
+        """Test that content type header is correctly set."""
+        strategy = make_strategy(
+            llm_case.strategy_cls, llm_case.api_key_env, "test-key"
+        )
+        assert strategy.apiClient.default_headers["Content-Type"] == "application/json"
+
+    def test_successful_query(self, llm_case):
+        """Test successful query to the provider API."""
+        llm_case.strategy.apiClient.post.return_value = StubResponse(
+            200, llm_case.payload("The answer is 42")
+        )
+        result = llm_case.strategy.query("What is the meaning of life?")
+        assert result == "The answer is 42"
+
+    @pytest.mark.parametrize("kind", ["empty", "malformed"])
+    def test_query_with_unusable_response(self, llm_case, kind):
+        """Test query handling when the API returns no usable text."""
+        payload = llm_case.empty_payload if kind == "empty" else {"invalid": "x"}
+        llm_case.strategy.apiClient.post.return_value = StubResponse(200, payload)
+        with pytest.raises(
+            llm_case.error_cls, match=f"Error querying {llm_case.provider}"
+        ):
+            llm_case.strategy.query("Test query")
+
+    @pytest.mark.usefixtures("failing_post")
+    def test_query_api_error(self, llm_case):
+        """Test query handling when API call fails."""
+        with pytest.raises(
+            llm_case.error_cls, match=f"Error querying {llm_case.provider}"
+        ):
+            llm_case.strategy.query("Test query")
+
+    def test_error_message_preservation(self, llm_case, failing_post):
+        """Test that original error messages are preserved in exceptions."""
+        original_error = str(failing_post.side_effect)
+
+        with pytest.raises(llm_case.error_cls) as exc_info:
+            llm_case.strategy.query("test")
+
+        assert original_error in str(exc_info.value)
+
+    def test_successful_refine_with_json_array(self, llm_case):
+        """Test successful refine operation returning valid tool plan."""
+        llm_case.strategy.apiClient.post.return_value = StubResponse(
+            200, llm_case.payload('[{"tool": "calculator", "args": {"expr": "2+2"}}]')
+        )
+        result = llm_case.strategy.refine("What is 2+2?")
+        assert isinstance(result, ToolPlan)
+        assert len(result.suggestions) >= 0
+
+    def test_refine_with_embedded_json(self, llm_case):
+        """Test refine operation with JSON embedded in text response."""
+        llm_case.strategy.apiClient.post.return_value = StubResponse(
+            200,
+            llm_case.payload(
+                'Here are the tools: [{"tool": "weather", "args": {"city": "Paris"}}]'
+                " for your query."
+            ),
+        )
+        result = llm_case.strategy.refine("What's the weather in Paris?")
+        assert isinstance(result, ToolPlan)
+        assert len(result.suggestions) >= 0
+
+    def test_refine_with_invalid_json(self, llm_case):
+        """Test refine handling with invalid JSON response."""
+        llm_case.strategy.apiClient.post.return_value = StubResponse(
+            200, llm_case.payload("invalid json response")
+        )
+        with pytest.raises(llm_case.error_cls, match="Error refining prompt"):
+            llm_case.strategy.refine("Test query")
+
+    @pytest.mark.usefixtures("failing_post")
+    def test_refine_api_error(self, llm_case):
+        """Test refine handling when API call fails."""
+        with pytest.raises(llm_case.error_cls, match="Error refining prompt"):
+            llm_case.strategy.refine("Test query")
+
+    def test_system_prompt_generation(self, llm_case):
+        """Test that system prompt is generated correctly."""
+        system_prompt = llm_case.strategy._get_system_prompt("What is 2+2?")
+
+        assert PROMPT_RE.search(system_prompt)
@@ -0,0 +1,194 @@
+"""Agent Smoke Tests across the stub, Gemini and OpenAI backends"""
+
+import importlib
+import os
+from pathlib import Path
+
+import pytest
+
+from tests.utils.constants import smoke
+from tests.utils.constants.smoke import keyword_pattern
+
+# Live backends are network-bound and independent, so they parallelise well past
+# the CPU count; their HTTP traffic is recorded to CASSETTE_DIR on first run and
+# replayed after. They are marked slow to keep them out of the default run.
+LLM_MARKS = [pytest.mark.llm_smoke, pytest.mark.slow, pytest.mark.vcr]
+
+# pytest-recording's per-module cassette directory; files are named after the test
+# node, so each one carries its backend's name
+CASSETTE_DIR = Path(__file__).parent / "cassettes" / Path(__file__).stem
+# Stand-in credentials for replay; recorded requests have theirs filtered out
+REPLAY_KEY = "cassette-replay"
+
+# backend -> (agent class path, API key the backend needs)
+BACKENDS = {
+    "stub": ("tests.utils.stubs.agent:AgentStub", None),
+    "gemini": ("src.lib.agents.gemini:GeminiAgent", "GEMINI_API_KEY"),
+    "openai": ("src.lib.agents.openai:OpenAIAgent", "OPENAI_API_KEY"),
+}
+
+# Keyword groups the answers are checked against, built once at import
+ADA_WORDS = frozenset({"ada", "lovelace", "mathematician", "computing"})
+ADA_EXTRA_WORDS = frozenset({"pioneer", "writer", "english", "math"})
+UNKNOWN_WORDS = frozenset({"unknown", "person"})
+NO_TOOL_WORDS = frozenset({"no", "valid", "tools"})
+TURING_WORDS = frozenset(
+    {"alan", "turing", "mathematician", "computer", "intelligence"}
+)
+WEATHER_WORDS = frozenset(
+    {"mild", "cloudy", "clear", "warm", "cool", "sunny", "rainy", "weather"}
+)
+WEATHER_DETAIL_WORDS = frozenset(
+    {"temperature", "condition", "humidity", "wind", "speed"}
+)
+
+# (prompt, minimum answer length, per-backend pattern any of whose keywords must appear)
+ANSWER_CASES = [
+    pytest.param(
+        "Who is Ada Lovelace?",
+        10,
+        {
+            "stub": keyword_pattern(*ADA_WORDS),
+            "gemini": keyword_pattern(
+                *ADA_WORDS, *ADA_EXTRA_WORDS, *smoke.APOLOGY_WORDS
+            ),
+            "openai": keyword_pattern(*ADA_WORDS, *ADA_EXTRA_WORDS),
+        },
+        id="ada_lovelace",
+    ),
+    pytest.param(
+        "Who is Unknown Person?",
+        10,
+        {
+            "stub": keyword_pattern(
+                *UNKNOWN_WORDS, *smoke.APOLOGY_WORDS, *NO_TOOL_WORDS
+            ),
+            "gemini": keyword_pattern(*UNKNOWN_WORDS, *smoke.APOLOGY_WORDS),
+            "openai": keyword_pattern(*UNKNOWN_WORDS, *smoke.APOLOGY_WORDS),
+        },
+        id="unknown_person",
+    ),
+    pytest.param(
+        "Who is Alan Turing?",
+        10,
+        {
+            "stub": keyword_pattern(*TURING_WORDS),
+            "gemini": keyword_pattern(*TURING_WORDS, *smoke.APOLOGY_WORDS),
+            "openai": keyword_pattern(*TURING_WORDS, *smoke.APOLOGY_WORDS),
+        },
+        id="alan_turing",
+    ),
+    pytest.param(
+        "What is 1 + 1?",
+        0,
+        {
+            "stub": keyword_pattern("2"),
+            "gemini": keyword_pattern("2", *smoke.APOLOGY_WORDS),
+            "openai": keyword_pattern("2"),
+        },
+        id="calculator_addition",
+    ),
+    pytest.param(
+        "What is 12.5% of 243?",
+        0,
+        {
+            "stub": keyword_pattern("30.375", "30"),
+            "gemini": keyword_pattern("30.375", "30", *smoke.APOLOGY_WORDS),
+            "openai": keyword_pattern("30.375", "30"),
+        },
+        id="percentage_calculation",
+    ),
+    pytest.param(
+        "Summarize today's weather in Paris in 3 words.",
+        5,
+        {
+            "stub": keyword_pattern(*WEATHER_WORDS),
+            "gemini": keyword_pattern(*WEATHER_WORDS, *smoke.APOLOGY_WORDS),
+            "openai": keyword_pattern(
+                *WEATHER_WORDS, *smoke.FAILURE_WORDS, *WEATHER_DETAIL_WORDS
+            ),
+        },
+        id="weather_summary",
+    ),
+]
+
+
+@pytest.fixture(
+    scope="session",
+    params=[
+        pytest.param("stub"),
+        pytest.param("gemini", marks=LLM_MARKS),
+        pytest.param("openai", marks=LLM_MARKS),
+    ],
+)
+def backend(request):
+    """Name of the agent backend under test."""
+    return request.param
+
+
+def _has_cassettes(backend):
+    """Whether any cassette has been recorded for a backend."""
+    return any(CASSETTE_DIR.glob(f"*{backend}*.yaml"))
+
+
+@pytest.fixture(scope="session")
+def agent(backend):
+    """
+    Share one agent per backend across the session. Agents are imported here so
+    deselecting a backend skips loading it. A live backend without an API key
+    replays its cassettes using stand-in keys, and is skipped if it has none.
+    """
+    class_path, api_key_env = BACKENDS[backend]
+    with pytest.MonkeyPatch.context() as mp:
+        if api_key_env and not os.environ.get(api_key_env):
+            if not _has_cassettes(backend):
+                pytest.skip(f"{api_key_env} is not set and no cassettes are recorded")
+            for env in (api_key_env, "WEATHER_API_KEY"):
+                if not os.environ.get(env):
+                    mp.setenv(env, REPLAY_KEY)
+        module_name, class_name = class_path.split(":")
+        yield getattr(importlib.import_module(module_name), class_name)()
+
+
+class TestAgentMatrix:
+    """Smoke test suite run against every agent backend."""
+
+    @pytest.mark.parametrize("prompt, min_length, keywords", ANSWER_CASES)
+    def test_answer(self, agent, backend, prompt, min_length, keywords):
+        """Test that the answer to a prompt mentions one of the expected keywords."""
+        out = agent.answer(prompt)
+        assert isinstance(out, str)
+        assert len(out) > min_length
+        assert keywords[backend].search(out)
+
+    def test_contextual_weather_math(self, agent, backend):
+        """Test contextual weather-based math calculation."""
+        out = agent.answer(
+            "Add 10 to the average temperature in Paris and London right now."
+        )
+        assert isinstance(out, str)
+        if backend == "stub":
+            assert float(out.replace("°C", "")) == 27.5
+        elif "°C" in out:
+            try:
+                temp_value = float(out.replace("°C", ""))
+                assert temp_value > 0
+            except ValueError:
+                pass
+        else:
+            assert smoke.FAILURE_OR_TEMPERATURE_RE.search(out)
+
+    def test_currency_conversion(self, agent, backend):
+        """Test currency conversion functionality."""
+        out = agent.answer("Convert the average of 10 and 20 USD into EUR.")
+        assert isinstance(out, str)
+        try:
+            numbers = smoke.NUMBER_RE.findall(out)
+            if numbers:
+                assert float(numbers[0]) > 0
+            else:
+                assert float(out) > 0
+        except (ValueError, IndexError):
+            if backend == "stub":
+                raise
+            assert smoke.FAILURE_RE.search(out)
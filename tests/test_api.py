@@ -1,28 +1,60 @@
 """Tests for API Client"""
 
-from unittest.mock import Mock, patch
+import json
+from unittest.mock import MagicMock, create_autospec
 
 import pytest
 import requests
+from requests.exceptions import ConnectionError as ReqConnErr
+from requests.exceptions import RequestException, Timeout
 
 from src.lib.api import ApiClient
+from src.lib.loggers import ApiLogger
+
+
+@pytest.fixture(scope="session")
+def _session_template():
+    """Autospec requests.Session once per session; introspection is the slow part."""
+    return create_autospec(requests.Session, instance=True)
+
+
+@pytest.fixture(scope="session")
+def _logger_template():
+    """Autospec the API logger once per session."""
+    return create_autospec(ApiLogger, instance=True)
+
+
+@pytest.fixture
+def session(_session_template):
+    """Fixture for a mocked requests.Session with calls and returns cleared."""
+    _session_template.reset_mock(return_value=True, side_effect=True)
+    return _session_template
+
+
+@pytest.fixture
+def mock_logger(_logger_template, monkeypatch):
+    """Fixture that swaps the shared logger mock in for the API client's logger."""
+    _logger_template.reset_mock()
+    monkeypatch.setattr("src.lib.api.api_logger", _logger_template)
+    return _logger_template
 
 
 @pytest.fixture
-def client():
-    """Fixture for ApiClient with base URL and timeout."""
-    return ApiClient(base_url="https://api.example.com", timeout=10)
+def client(session):
+    """Fixture for ApiClient with base URL and timeout, backed by the mocked session."""
+    return ApiClient(base_url="https://api.example.com", timeout=10, session=session)
 
 
 @pytest.fixture
 def mock_response():
-    """Factory fixture to create a mock response object."""
+    """Factory fixture for a canned requests.Response, with a JSON body if given."""
 
     def _create(status_code=200, text="OK", json_data=None):
-        response = Mock()
+        response = requests.Response()
         response.status_code = status_code
-        response.text = text
-        response.json.return_value = json_data or {}
+        response.encoding = "utf-8"
+        body = json.dumps(json_data) if json_data is not None else text
+        response._content = body.encode()
         return response
 
     return _create
@@ -46,6 +78,26 @@ class TestApiClient:
         assert client.default_headers == headers
         assert client.timeout == 60
 
+    def test_creates_session_per_client(self):
+        first, second = ApiClient(), ApiClient()
+        assert isinstance(first._session, requests.Session)
+        assert first._session is not second._session
+
+    def test_shared_session_is_reused(self, session, mock_logger, mock_response):
+        session.get.return_value = mock_response(200)
+        session.post.return_value = mock_response(200)
+        first = ApiClient(base_url="https://api.example.com", session=session)
+        second = ApiClient(base_url="https://api.example.com", session=session)
+        first.get("/a")
+        second.post("/b", data={})
+
+        session.get.assert_called_once()
+        session.post.assert_called_once()
+
+    def test_close_closes_session(self, client, session):
+        client.close()
+        session.close.assert_called_once()
+
     def test_build_url_with_and_without_base(self, client):
         assert client._build_url("/endpoint") == "https://api.example.com/endpoint"
         assert client._build_url("endpoint") == "https://api.example.com/endpoint"
@@ -67,149 +119,157 @@ class TestApiClient:
         client.set_auth_header("custom_value", "Custom")
         assert client.default_headers["Authorization"] == "Custom custom_value"
 
-    def test_successful_get_request(self, client, mock_response):
+    def test_successful_get_request(self, client, session, mock_logger, mock_response):
         response = mock_response(200, "Success", {"status": "ok"})
-        with patch("requests.get", return_value=response) as mock_get, patch(
-            "src.lib.api.api_logger"
-        ) as mock_logger:
-            result = client.get("/test")
-
-            assert result == response
-            mock_get.assert_called_once_with(
-                "https://api.example.com/test", headers={}, params=None, timeout=10
-            )
-            mock_logger.log_successful_call.assert_called_once()
-
-    def test_get_request_with_params_and_headers(self, client, mock_response):
-        response = mock_response(200)
-        with patch("requests.get", return_value=response) as mock_get, patch(
-            "src.lib.api.api_logger"
-        ):
-            params = {"key": "value"}
-            headers = {"Custom-Header": "custom-value"}
-            client.get("/test", params=params, headers=headers)
-
-            expected_headers = {**client.default_headers, **headers}
-            mock_get.assert_called_once_with(
-                "https://api.example.com/test",
-                headers=expected_headers,
-                params=params,
-                timeout=10,
-            )
-
-    def test_successful_post_request(self, client, mock_response):
+        session.get.return_value = response
+
+        result = client.get("/test")
+
+        assert result == response
+        session.get.assert_called_once_with(
+            "https://api.example.com/test", headers={}, params=None, timeout=10
+        )
+        mock_logger.log_successful_call.assert_called_once()
+
+    def test_get_request_with_params_and_headers(
+        self, client, session, mock_logger, mock_response
+    ):
+        session.get.return_value = mock_response(200)
+        params = {"key": "value"}
+        headers = {"Custom-Header": "custom-value"}
+        client.get("/test", params=params, headers=headers)
+
+        expected_headers = {**client.default_headers, **headers}
+        session.get.assert_called_once_with(
+            "https://api.example.com/test",
+            headers=expected_headers,
+            params=params,
+            timeout=10,
+        )
+
+    def test_successful_post_request(self, client, session, mock_logger, mock_response):
         response = mock_response(200, "Created")
-        with patch("requests.post", return_value=response) as mock_post, patch(
-            "src.lib.api.api_logger"
-        ) as mock_logger:
-            result = client.post("/create", data={"x": 1})
-            assert result == response
-            mock_post.assert_called_once()
-            mock_logger.log_successful_call.assert_called_once()
-
-    def test_post_request_with_headers(self, client, mock_response):
-        response = mock_response(200)
-        with patch("requests.post", return_value=response) as mock_post, patch(
-            "src.lib.api.api_logger"
-        ):
-            headers = {"Content-Type": "application/json"}
-            client.post("/test", data={}, headers=headers)
-
-            expected_headers = {**client.default_headers, **headers}
-            mock_post.assert_called_once_with(
-                "https://api.example.com/test",
-                data={},
-                json=None,
-                headers=expected_headers,
-                timeout=10,
-            )
-
-    def test_request_exceptions(self, client):
-        with patch(
-            "requests.get", side_effect=requests.exceptions.Timeout("Timeout")
-        ), patch("src.lib.api.api_logger") as mock_logger:
-            with pytest.raises(requests.exceptions.RequestException):
-                client.get("/test")
-            mock_logger.log_failed_call.assert_called_once()
-
-        with patch(
-            "requests.get",
-            side_effect=requests.exceptions.ConnectionError("Connection failed"),
-        ), patch("src.lib.api.api_logger") as mock_logger:
-            with pytest.raises(requests.exceptions.RequestException):
-                client.get("/test")
-            mock_logger.log_failed_call.assert_called_once()
-
-    def test_post_http_error(self, client, mock_response):
-        response = mock_response(400, "Bad Request")
-        response.raise_for_status.side_effect = requests.exceptions.HTTPError(
-            "400 error"
+        session.post.return_value = response
+
+        result = client.post("/create", data={"x": 1})
+
+        assert result == response
+        session.post.assert_called_once()
+        mock_logger.log_successful_call.assert_called_once()
+
+    def test_post_request_with_headers(
+        self, client, session, mock_logger, mock_response
+    ):
+        session.post.return_value = mock_response(200)
+        headers = {"Content-Type": "application/json"}
+        client.post("/test", data={}, headers=headers)
+
+        expected_headers = {**client.default_headers, **headers}
+        session.post.assert_called_once_with(
+            "https://api.example.com/test",
+            data={},
+            json=None,
+            headers=expected_headers,
+            timeout=10,
         )
-        with patch("requests.post", return_value=response) as mock_post, patch(
-            "src.lib.api.api_logger"
-        ) as mock_logger:
-            result = client.post("/test", data={})
-            assert result == response
-            mock_logger.log_failed_call.assert_called_once()
-
-    def test_get_request_with_default_headers(self, client, mock_response):
-        response = mock_response(200)
-        client.set_default_headers({"User-Agent": "TestClient"})
-        with patch("requests.get", return_value=response) as mock_get, patch(
-            "src.lib.api.api_logger"
-        ):
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            Timeout("Timeout"),
+            ReqConnErr("Connection failed"),
+        ],
+        ids=["timeout", "connection"],
+    )
+    def test_request_exceptions(self, client, session, mock_logger, error):
+        session.get.side_effect = error
+        with pytest.raises(RequestException):
             client.get("/test")
-            mock_get.assert_called_once_with(
-                "https://api.example.com/test",
-                headers={"User-Agent": "TestClient"},
-                params=None,
-                timeout=10,
-            )
-
-    def test_header_override(self, client, mock_response):
-        response = mock_response(200)
+        mock_logger.log_failed_call.assert_called_once()
+
+    def test_post_http_error(self, client, session, mock_logger, mock_response):
+        response = mock_response(400, "Bad Request")
+        session.post.return_value = response
+
+        result = client.post("/test", data={})
+
+        assert result == response
+        mock_logger.log_failed_call.assert_called_once()
+
+    def test_get_request_with_default_headers(
+        self, client, session, mock_logger, mock_response
+    ):
+        session.get.return_value = mock_response(200)
+        client.set_default_headers({"User-Agent": "TestClient"})
+        client.get("/test")
+        session.get.assert_called_once_with(
+            "https://api.example.com/test",
+            headers={"User-Agent": "TestClient"},
+            params=None,
+            timeout=10,
+        )
+
+    def test_header_override(self, client, session, mock_logger, mock_response):
+        session.post.return_value = mock_response(200)
         client.set_default_headers({"Content-Type": "xml"})
-        with patch("requests.post", return_value=response) as mock_post, patch(
-            "src.lib.api.api_logger"
-        ):
-            client.post("/test", data={}, headers={"Content-Type": "json"})
-            mock_post.assert_called_once_with(
-                "https://api.example.com/test",
-                data={},
-                json=None,
-                headers={"Content-Type": "json"},
-                timeout=10,
-            )
-
-    def test_response_time_measurement(self, client, mock_response):
-        response = mock_response(200)
-        with patch("requests.get", return_value=response), patch(
-            "time.time", side_effect=[1000.0, 1002.5]
-        ), patch("src.lib.api.api_logger") as mock_logger:
-            client.get("/test")
-            call_args = mock_logger.log_successful_call.call_args[0][0]
-            assert call_args.response_time == 2.5
-
-    def test_logging_successful_call_details(self, client, mock_response):
-        response = mock_response(200)
-        with patch("requests.get", return_value=response), patch(
-            "src.lib.api.api_logger"
-        ) as mock_logger:
-            client.get("/test", params={"key": "value"})
-            log_entry = mock_logger.log_successful_call.call_args[0][0]
-            assert log_entry.url == "https://api.example.com/test"
-            assert log_entry.method == "GET"
-            assert log_entry.response_code.value == 200
-            assert log_entry.payload == {"key": "value"}
-
-    def test_logging_failed_call_details(self, client):
-        with patch(
-            "requests.post", side_effect=requests.exceptions.ConnectionError("fail")
-        ), patch("src.lib.api.api_logger") as mock_logger:
-            with pytest.raises(requests.exceptions.RequestException):
-                client.post("/test", data={"key": "value"})
-            log_entry = mock_logger.log_failed_call.call_args[0][0]
-            assert log_entry.url == "https://api.example.com/test"
-            assert log_entry.method == "POST"
-            assert log_entry.error == "fail"
-            assert log_entry.payload == {"key": "value"}
+        client.post("/test", data={}, headers={"Content-Type": "json"})
+        session.post.assert_called_once_with(
+            "https://api.example.com/test",
+            data={},
+            json=None,
+            headers={"Content-Type": "json"},
+            timeout=10,
+        )
+
+    def test_response_time_measurement(self, session, mock_logger, mock_response):
+        session.get.return_value = mock_response(200)
+        client = ApiClient(session=session, clock=iter([1000.0, 1002.5]).__next__)
+        client.get("https://api.example.com/test")
+        call_args = mock_logger.log_successful_call.call_args[0][0]
+        assert call_args.response_time == 2.5
+
+    def test_logging_successful_call_details(
+        self, client, session, mock_logger, mock_response
+    ):
+        session.get.return_value = mock_response(200)
+        client.get("/test", params={"key": "value"})
+        log_entry = mock_logger.log_successful_call.call_args[0][0]
+        assert log_entry.url == "https://api.example.com/test"
+        assert log_entry.method == "GET"
+        assert log_entry.response_code.value == 200
+        assert log_entry.payload == {"key": "value"}
+
+    def test_logging_failed_call_details(self, client, session, mock_logger):
+        session.post.side_effect = ReqConnErr("fail")
+        with pytest.raises(RequestException):
+            client.post("/test", data={"key": "value"})
+        log_entry = mock_logger.log_failed_call.call_args[0][0]
+        assert log_entry.url == "https://api.example.com/test"
+        assert log_entry.method == "POST"
+        assert log_entry.error == "fail"
+        assert log_entry.payload == {"key": "value"}
+
+    def test_post_stream_yields_sse_events(self, client, session, mock_logger):
+        response = MagicMock(spec=requests.Response)
+        response.status_code = 200
+        response.iter_lines.return_value = [
+            'data: {"delta": "Hello"}',
+            "",
+            ": keep-alive",
+            'data: {"delta": " world"}',
+            "data: [DONE]",
+            'data: {"delta": "ignored"}',
+        ]
+        session.post.return_value = response
+
+        events = list(client.post_stream("/stream", json_data={"q": "hi"}))
+
+        assert events == [{"delta": "Hello"}, {"delta": " world"}]
+        assert session.post.call_args.kwargs["stream"] is True
+        mock_logger.log_successful_call.assert_called_once()
+
+    def test_post_stream_http_error(self, client, session, mock_logger, mock_response):
+        session.post.return_value = mock_response(500, "Server Error")
+        with pytest.raises(RequestException):
+            list(client.post_stream("/stream", json_data={}))
+        mock_logger.log_failed_call.assert_called_once()
@@ -0,0 +1,11 @@
+"""Shared fixtures for tool tests."""
+
+import pytest
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _weather_env():
+    """Set a fake WEATHER_API_KEY for each module under tests/tools, then restore it."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("WEATHER_API_KEY", "test_api_key")
+        yield
@@ -2,72 +2,61 @@
 
 import pytest
 
+from src.lib.errors.tools.calculator import TokenizationError
 from src.lib.tools.calculator import Calculator
 
+pytestmark = pytest.mark.xdist_group("tools_calculator")
+
+CASES = [
+    pytest.param("1 + 1", "2.0", id="addition"),
+    pytest.param("1 - 1", "0.0", id="subtraction"),
+    pytest.param("2 * 2", "4.0", id="multiplication"),
+    pytest.param("4 / 2", "2.0", id="division"),
+    pytest.param("5 % 2", "1.0", id="modulus"),
+    pytest.param("2 ^ 3", "8.0", id="power"),
+    pytest.param("1 + 2 * 3 - 4 / 2", "5.0", id="complex_expression"),
+    pytest.param("(1 + 2) * 3", "9.0", id="paranthesis_expression"),
+    pytest.param("1 + {(2 * 3) - 4}", "3.0", id="curly_bracket_expression"),
+    pytest.param("1 + ([{2 * (3 - 4)} - 2])", "-3.0", id="square_bracket_expression"),
+    pytest.param(
+        "({[2 + 3 * (4 - 1)] + 5} * 2) - [3 ^ 2]", "23.0", id="mixed_brackets_complex_1"
+    ),
+    pytest.param(
+        "[({2 + 3} * (4 + [5 - 2])) / {5}] + 7", "14.0", id="mixed_brackets_complex_2"
+    ),
+    pytest.param(
+        "{[2 ^ (1 + 2)] % (5 - 2)} + (6 / [3])", "4.0", id="mixed_brackets_complex_3"
+    ),
+    pytest.param(
+        "({[2 + 3] * (4 + 5)} - 6) / {7 - [8 % 3]}",
+        "7.8",
+        id="mixed_brackets_complex_4",
+    ),
+]
+
 
-@pytest.mark.usefixtures("calc")
 class TestCalculator:
     """Test suite for Calculator tool."""
 
-    @pytest.fixture(autouse=True)
+    @pytest.fixture(scope="class")
     def calc(self):
-        """Fixture that provides a Calculator instance for each test."""
-        self.calc = Calculator()
-
-    def test_addition(self):
-        result = self.calc.execute({"expr": "1 + 1"})
-        assert result == "2.0"
-
-    def test_subtraction(self):
-        result = self.calc.execute({"expr": "1 - 1"})
-        assert result == "0.0"
-
-    def test_multiplication(self):
-        result = self.calc.execute({"expr": "2 * 2"})
-        assert result == "4.0"
-
-    def test_division(self):
-        result = self.calc.execute({"expr": "4 / 2"})
-        assert result == "2.0"
-
-    def test_modulus(self):
-        result = self.calc.execute({"expr": "5 % 2"})
-        assert result == "1.0"
-
-    def test_power(self):
-        result = self.calc.execute({"expr": "2 ^ 3"})
-        assert result == "8.0"
-
-    def test_complex_expression(self):
-        result = self.calc.execute({"expr": "1 + 2 * 3 - 4 / 2"})
-        assert result == "5.0"
-
-    def test_paranthesis_expression(self):
-        result = self.calc.execute({"expr": "(1 + 2) * 3"})
-        assert result == "9.0"
-
-    def test_curly_bracket_expression(self):
-        result = self.calc.execute({"expr": "1 + {(2 * 3) - 4}"})
-        assert result == "3.0"
-
-    def test_square_bracket_expression(self):
-        result = self.calc.execute({"expr": "1 + ([{2 * (3 - 4)} - 2])"})
-        assert result == "-3.0"
-
-    def test_mixed_brackets_complex_1(self):
-        result = self.calc.execute({"expr": "({[2 + 3 * (4 - 1)] + 5} * 2) - [3 ^ 2]"})
-        assert result == "23.0"
-
-    def test_mixed_brackets_complex_2(self):
-        result = self.calc.execute({"expr": "[({2 + 3} * (4 + [5 - 2])) / {5}] + 7"})
-        assert result == "14.0"
-
-    def test_mixed_brackets_complex_3(self):
-        result = self.calc.execute({"expr": "{[2 ^ (1 + 2)] % (5 - 2)} + (6 / [3])"})
-        assert result == "4.0"
-
-    def test_mixed_brackets_complex_4(self):
-        result = self.calc.execute(
-            {"expr": "({[2 + 3] * (4 + 5)} - 6) / {7 - [8 % 3]}"}
-        )
-        assert result == "7.8"
+        """Fixture to share one Calculator across the class; execute is pure."""
+        return Calculator()
+
+    @pytest.mark.parametrize("expr, expected", CASES)
+    def test_eval(self, calc, expr, expected):
+        assert calc.execute({"expr": expr}) == expected
+
+    def test_repeated_expression_is_cached(self, calc):
+        hits = calc._evaluate.cache_info().hits
+        assert calc.execute({"expr": "6 * 7"}) == "42.0"
+        assert Calculator().execute({"expr": "  6 * 7 "}) == "42.0"
+        assert calc._evaluate.cache_info().hits == hits + 1
+
+    def test_whitespace_between_tokens(self, calc):
+        assert calc.execute({"expr": "3\t+\n4"}) == "7.0"
+
+    @pytest.mark.parametrize("expr", ["2a", "1 + $"])
+    def test_invalid_character(self, calc, expr):
+        with pytest.raises(TokenizationError, match="Invalid character"):
+            calc.execute({"expr": expr})
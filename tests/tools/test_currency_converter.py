@@ -1,6 +1,8 @@
 """Tests for Currency Converter Tool"""
 
-from unittest.mock import Mock, patch
+import re
+from types import MappingProxyType
+from unittest.mock import Mock
 
 import pytest
 
@@ -9,159 +11,194 @@ from src.lib.errors.tools.currency_converter import (ConversionRateError,
                                                      CurrencyAPIError,
                                                      InvalidCurrencyError)
 from src.lib.tools.currency_converter import CurrencyConverter
-
-
-@pytest.mark.usefixtures("converter_fixture")
-class TestCurrencyConverter:
-    """Test suite for Currency Converter tool."""
-
-    @pytest.fixture(autouse=True)
-    def converter_fixture(self):
-        """Fixture that provides a CurrencyConverter instance for each test."""
-        self.converter = CurrencyConverter()
-
-    def _mock_response(self, status_code=200, json_data=None, text=None):
-        """Helper to create a mock API response."""
-        mock_response = Mock()
-        mock_response.status_code = status_code
-        if json_data is not None:
-            mock_response.json.return_value = json_data
-        if text is not None:
-            mock_response.text = text
-        return mock_response
-
-    def test_successful_conversion(self):
-        mock_response = self._mock_response(
-            200,
+from tests.utils.stubs.response import StubResponse
+
+pytestmark = pytest.mark.xdist_group("tools_currency_converter")
+
+# Error messages the tests match, compiled once at import
+_INVALID_CURRENCY_RE = re.compile("Invalid currency code")
+_MISSING_FROM_RE = re.compile("Missing required parameter: from")
+_MISSING_TO_RE = re.compile("Missing required parameter: to")
+_MISSING_AMOUNT_RE = re.compile("Missing required parameter: amount")
+_NOT_POSITIVE_RE = re.compile("Amount must be a positive number")
+_API_ERROR_RE = re.compile("Currency API error")
+_RATE_NOT_FOUND_RE = re.compile("Conversion rate not found")
+_INVALID_FORMAT_RE = re.compile("Invalid API response format")
+_CONVERSION_FAILED_RE = re.compile("Currency conversion failed")
+
+USD_TO_EUR = {"from": "USD", "to": "EUR", "amount": 100.0}
+
+# (request args, API JSON body, expected result); bodies are shared read-only
+SUCCESS_CASES = [
+    pytest.param(
+        USD_TO_EUR,
+        MappingProxyType(
             {
                 "amount": 100.0,
                 "base": "USD",
                 "date": "2024-01-01",
                 "rates": {"EUR": 85.23},
-            },
-        )
-        with patch.object(self.converter.apiClient, "get", return_value=mock_response):
-            result = self.converter.execute(
-                {"from": "USD", "to": "EUR", "amount": 100.0}
-            )
-            assert result == "85.23"
-
-    def test_conversion_with_different_currencies(self):
-        mock_response = self._mock_response(
-            200,
+            }
+        ),
+        "85.23",
+        id="successful_conversion",
+    ),
+    pytest.param(
+        {"from": "GBP", "to": "JPY", "amount": 50.0},
+        MappingProxyType(
             {
                 "amount": 50.0,
                 "base": "GBP",
                 "date": "2024-01-01",
                 "rates": {"JPY": 6750.5},
-            },
-        )
-        with patch.object(self.converter.apiClient, "get", return_value=mock_response):
-            result = self.converter.execute(
-                {"from": "GBP", "to": "JPY", "amount": 50.0}
-            )
-            assert result == "6750.5"
-
-    def test_conversion_with_decimal_amount(self):
-        mock_response = self._mock_response(
-            200,
+            }
+        ),
+        "6750.5",
+        id="different_currencies",
+    ),
+    pytest.param(
+        {"from": "USD", "to": "CAD", "amount": 25.75},
+        MappingProxyType(
             {
                 "amount": 25.75,
                 "base": "USD",
                 "date": "2024-01-01",
                 "rates": {"CAD": 34.51},
-            },
-        )
-        with patch.object(self.converter.apiClient, "get", return_value=mock_response):
-            result = self.converter.execute(
-                {"from": "USD", "to": "CAD", "amount": 25.75}
-            )
-            assert result == "34.51"
-
-    def test_missing_from_currency(self):
-        with pytest.raises(
-            ConversionRequestError, match="Missing required parameter: from"
-        ):
-            self.converter.execute({"to": "EUR", "amount": 100.0})
-
-    def test_missing_to_currency(self):
-        with pytest.raises(
-            ConversionRequestError, match="Missing required parameter: to"
-        ):
-            self.converter.execute({"from": "USD", "amount": 100.0})
-
-    def test_missing_amount(self):
-        with pytest.raises(
-            ConversionRequestError, match="Missing required parameter: amount"
-        ):
-            self.converter.execute({"from": "USD", "to": "EUR"})
-
-    def test_invalid_amount_type(self):
-        with pytest.raises(
-            ConversionRequestError, match="Amount must be a positive number"
-        ):
-            self.converter.execute({"from": "USD", "to": "EUR", "amount": "invalid"})
-
-    def test_negative_amount(self):
-        with pytest.raises(
-            ConversionRequestError, match="Amount must be a positive number"
-        ):
-            self.converter.execute({"from": "USD", "to": "EUR", "amount": -100.0})
-
-    def test_zero_amount(self):
-        with pytest.raises(
-            ConversionRequestError, match="Amount must be a positive number"
-        ):
-            self.converter.execute({"from": "USD", "to": "EUR", "amount": 0})
-
-    def test_invalid_currency_code(self):
-        mock_response = self._mock_response(400, text="Invalid currency code")
-        with patch.object(self.converter.apiClient, "get", return_value=mock_response):
-            with pytest.raises(InvalidCurrencyError, match="Invalid currency code"):
-                self.converter.execute(
-                    {"from": "INVALID", "to": "EUR", "amount": 100.0}
-                )
-
-    def test_api_server_error(self):
-        mock_response = self._mock_response(500, text="Internal server error")
-        with patch.object(self.converter.apiClient, "get", return_value=mock_response):
-            with pytest.raises(CurrencyAPIError, match="Currency API error"):
-                self.converter.execute({"from": "USD", "to": "EUR", "amount": 100.0})
-
-    def test_missing_conversion_rate(self):
-        mock_response = self._mock_response(
-            200,
-            {"amount": 100.0, "base": "USD", "date": "2024-01-01", "rates": {}},
-        )
-        with patch.object(self.converter.apiClient, "get", return_value=mock_response):
-            with pytest.raises(ConversionRateError, match="Conversion rate not found"):
-                self.converter.execute({"from": "USD", "to": "EUR", "amount": 100.0})
-
-    def test_malformed_api_response(self):
-        mock_response = self._mock_response(200, {"invalid": "response"})
-        with patch.object(self.converter.apiClient, "get", return_value=mock_response):
-            with pytest.raises(CurrencyAPIError, match="Invalid API response format"):
-                self.converter.execute({"from": "USD", "to": "EUR", "amount": 100.0})
-
-    def test_network_error(self):
-        with patch.object(
-            self.converter.apiClient, "get", side_effect=Exception("Network error")
-        ):
-            with pytest.raises(CurrencyAPIError, match="Currency conversion failed"):
-                self.converter.execute({"from": "USD", "to": "EUR", "amount": 100.0})
-
-    def test_same_currency_conversion(self):
-        mock_response = self._mock_response(
-            200,
+            }
+        ),
+        "34.51",
+        id="decimal_amount",
+    ),
+    pytest.param(
+        {"from": "USD", "to": "USD", "amount": 100.0},
+        MappingProxyType(
             {
                 "amount": 100.0,
                 "base": "USD",
                 "date": "2024-01-01",
                 "rates": {"USD": 100.0},
-            },
-        )
-        with patch.object(self.converter.apiClient, "get", return_value=mock_response):
-            result = self.converter.execute(
-                {"from": "USD", "to": "USD", "amount": 100.0}
-            )
-            assert result == "100.0"
+            }
+        ),
+        "100.0",
+        id="same_currency",
+    ),
+]
+
+# (request args, expected error message) for requests rejected before any API call
+INVALID_REQUEST_CASES = [
+    pytest.param(
+        {"to": "EUR", "amount": 100.0},
+        _MISSING_FROM_RE,
+        id="missing_from_currency",
+    ),
+    pytest.param(
+        {"from": "USD", "amount": 100.0},
+        _MISSING_TO_RE,
+        id="missing_to_currency",
+    ),
+    pytest.param(
+        {"from": "USD", "to": "EUR"},
+        _MISSING_AMOUNT_RE,
+        id="missing_amount",
+    ),
+    pytest.param(
+        {"from": "USD", "to": "EUR", "amount": "invalid"},
+        _NOT_POSITIVE_RE,
+        id="invalid_amount_type",
+    ),
+    pytest.param(
+        {"from": "USD", "to": "EUR", "amount": -100.0},
+        _NOT_POSITIVE_RE,
+        id="negative_amount",
+    ),
+    pytest.param(
+        {"from": "USD", "to": "EUR", "amount": 0},
+        _NOT_POSITIVE_RE,
+        id="zero_amount",
+    ),
+]
+
+# (request args, status code, API JSON body or text, expected error, message)
+API_ERROR_CASES = [
+    pytest.param(
+        {"from": "INVALID", "to": "EUR", "amount": 100.0},
+        400,
+        "Invalid currency code",
+        InvalidCurrencyError,
+        _INVALID_CURRENCY_RE,
+        id="invalid_currency_code",
+    ),
+    pytest.param(
+        USD_TO_EUR,
+        500,
+        "Internal server error",
+        CurrencyAPIError,
+        _API_ERROR_RE,
+        id="api_server_error",
+    ),
+    pytest.param(
+        USD_TO_EUR,
+        200,
+        MappingProxyType(
+            {"amount": 100.0, "base": "USD", "date": "2024-01-01", "rates": {}}
+        ),
+        ConversionRateError,
+        _RATE_NOT_FOUND_RE,
+        id="missing_conversion_rate",
+    ),
+    pytest.param(
+        USD_TO_EUR,
+        200,
+        MappingProxyType({"invalid": "response"}),
+        CurrencyAPIError,
+        _INVALID_FORMAT_RE,
+        id="malformed_api_response",
+    ),
+]
+
+
+class TestCurrencyConverter:
+    """Test suite for Currency Converter tool."""
+
+    @pytest.fixture(scope="class")
+    def converter(self):
+        """Fixture to share one CurrencyConverter instance across the class."""
+        return CurrencyConverter()
+
+    @pytest.fixture(scope="class")
+    def _class_get(self, converter):
+        """Swap the API client's get for a Mock once per class and restore it after."""
+        with pytest.MonkeyPatch.context() as mp:
+            mock = Mock()
+            mp.setattr(converter.apiClient, "get", mock)
+            yield mock
+
+    @pytest.fixture
+    def mock_get(self, _class_get):
+        """Provide the class's get Mock with calls and configured returns cleared."""
+        _class_get.reset_mock(return_value=True, side_effect=True)
+        return _class_get
+
+    @pytest.mark.parametrize("args, json_data, expected", SUCCESS_CASES)
+    def test_successful_execute(self, converter, mock_get, args, json_data, expected):
+        mock_get.return_value = StubResponse(200, json_data)
+        assert converter.execute(args) == expected
+
+    @pytest.mark.parametrize("args, match", INVALID_REQUEST_CASES)
+    def test_invalid_request(self, converter, args, match):
+        with pytest.raises(ConversionRequestError, match=match):
+            converter.execute(args)
+
+    @pytest.mark.parametrize("args, status, body, error, match", API_ERROR_CASES)
+    def test_api_error(self, converter, mock_get, args, status, body, error, match):
+        if isinstance(body, MappingProxyType):
+            mock_get.return_value = StubResponse(status, json_data=body)
+        else:
+            mock_get.return_value = StubResponse(status, text=body)
+        with pytest.raises(error, match=match):
+            converter.execute(args)
+
+    def test_network_error(self, converter, mock_get):
+        mock_get.side_effect = Exception("Network error")
+        with pytest.raises(CurrencyAPIError, match=_CONVERSION_FAILED_RE):
+            converter.execute(USD_TO_EUR)
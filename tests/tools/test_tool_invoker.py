@@ -0,0 +1,62 @@
+"""Tests for ToolInvoker"""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.data.schemas.tools.tool_response import ToolResponse
+from src.lib.tools.tool_invoker import ToolInvoker
+
+pytestmark = pytest.mark.xdist_group("tools_invoker")
+
+
+class TestToolInvoker:
+    """Test suite for the ToolInvoker execute contract."""
+
+    @pytest.fixture
+    def invoker(self):
+        """Fixture for a fresh ToolInvoker with the calculator set."""
+        invoker = ToolInvoker()
+        invoker.set_action("calculator")
+        return invoker
+
+    def test_execute_returns_successful_response(self, invoker):
+        """Test that a tool result is wrapped in a successful ToolResponse."""
+        response = invoker.execute({"expr": "2 + 2"})
+        assert response == ToolResponse(
+            tool="calculator", args={"expr": "2 + 2"}, success=True, result="4.0"
+        )
+
+    def test_execute_returns_failed_response(self, invoker):
+        """Test that a tool exception is returned as a failed ToolResponse."""
+        response = invoker.execute({"expr": ""})
+        assert response.success is False
+        assert response.result is None
+        assert response.error == "Tool execution failed: No expression provided"
+
+    def test_execute_without_action(self):
+        """Test that executing before set_action raises."""
+        with pytest.raises(RuntimeError, match="No tool action set"):
+            ToolInvoker().execute({"expr": "1"})
+
+    def test_set_action_rejects_unknown_tool(self, invoker):
+        """Test that an unknown tool type is rejected."""
+        with pytest.raises(ValueError, match="Unknown tool type"):
+            invoker.set_action("unknown")
+
+    def test_set_action_reuses_tool_instances(self, invoker):
+        """Test that each tool is built once per invoker."""
+        first = invoker._ToolInvoker__action
+        invoker.set_action("knowledge_base")
+        invoker.set_action("calculator")
+        assert invoker._ToolInvoker__action is first
+
+    def test_close_closes_cached_tools(self, invoker):
+        """Test that close releases every tool the invoker built."""
+        invoker.set_action("currency_converter")
+        converter = invoker._ToolInvoker__action
+        with patch.object(converter.apiClient, "close") as mock_close:
+            invoker.close()
+        mock_close.assert_called_once()
+        invoker.set_action("currency_converter")
+        assert invoker._ToolInvoker__action is not converter
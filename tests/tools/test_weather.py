@@ -1,6 +1,9 @@
 """Tests for Weather Tool"""
 
-from unittest.mock import Mock, patch
+import functools
+import re
+from types import MappingProxyType
+from unittest.mock import Mock
 
 import pytest
 
@@ -8,53 +11,114 @@ from src.lib.errors.tools.weather import (CityNotFoundError, WeatherAPIError,
                                           WeatherConfigurationError,
                                           WeatherRequestError)
 from src.lib.tools.weather import Weather
+from tests.utils.stubs.response import StubResponse
+
+pytestmark = [pytest.mark.mock_http, pytest.mark.xdist_group("tools_weather")]
+
+# Error messages the tests match, compiled once at import
+_CITY_REQUIRED_RE = re.compile("City parameter is required")
+_CITY_EMPTY_RE = re.compile("City name cannot be empty")
+_CITY_NOT_FOUND_RE = re.compile("City 'InvalidCity' not found")
+_API_KEY_REQUIRED_RE = re.compile("WEATHER_API_KEY environment variable is required")
+_API_ERROR_RE = re.compile("Weather API error")
+_INVALID_FORMAT_RE = re.compile("Invalid weather data format")
+_REQUEST_FAILED_RE = re.compile("Weather request failed")
+
+# A clear 15°C day in London; scenarios override the fields they vary. Payloads are
+# built once and shared read-only, so they are wrapped in MappingProxyType.
+_WEATHER_TEMPLATE = MappingProxyType(
+    {
+        "name": "London",
+        "weather": [{"id": 800, "main": "Clear", "description": "clear sky"}],
+        "main": {
+            "temp": 288.15,
+            "pressure": 1013,
+            "humidity": 65,
+            "temp_min": 287.15,
+            "temp_max": 289.15,
+        },
+        "wind": {"speed": 3.5, "deg": 180},
+        "clouds": {"all": 20},
+        "sys": {"country": "GB", "sunrise": 1640000000, "sunset": 1640030000},
+        "cod": 200,
+    }
+)
+
+_OPTIONAL_FIELDS_MISSING = MappingProxyType(
+    {
+        **{
+            key: value
+            for key, value in _WEATHER_TEMPLATE.items()
+            if key not in ("wind", "clouds")
+        },
+        "name": "TestCity",
+        "sys": {**_WEATHER_TEMPLATE["sys"], "country": "XX"},
+    }
+)
+_MALFORMED = MappingProxyType({"invalid": "response"})
+
+
+def _weather_json(city, temp_kelvin, description, humidity, spread):
+    """Build an API payload from the template for a city at a given temperature."""
+    return {
+        **_WEATHER_TEMPLATE,
+        "name": city,
+        "weather": [{"id": 800, "main": "Clear", "description": description}],
+        "main": {
+            **_WEATHER_TEMPLATE["main"],
+            "temp": temp_kelvin,
+            "humidity": humidity,
+            "temp_min": temp_kelvin - spread,
+            "temp_max": temp_kelvin + spread,
+        },
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _response_for(temp_kelvin, description="clear", city="ExtremeCity"):
+    """Canned response for a city at a temperature, built once per distinct case."""
+    json_data = {
+        **_weather_json(city, temp_kelvin, description, humidity=50, spread=1),
+        "wind": {"speed": 1.0, "deg": 0},
+        "clouds": {"all": 0},
+        "sys": {**_WEATHER_TEMPLATE["sys"], "country": "XX"},
+    }
+    return StubResponse(200, json_data)
 
 
-@pytest.mark.usefixtures("weather_fixture")
 class TestWeather:
     """Test suite for Weather tool."""
 
-    @pytest.fixture(autouse=True)
-    def weather_fixture(self):
-        """Fixture to create Weather instance with patched API key."""
-        with patch.dict("os.environ", {"WEATHER_API_KEY": "test_api_key"}):
-            self.weather = Weather()
-
-    def _mock_response(self, status_code=200, json_data=None, text=""):
-        """Helper to build a mock API response."""
-        mock = Mock()
-        mock.status_code = status_code
-        mock.text = text
-        if json_data is not None:
-            mock.json.return_value = json_data
-        return mock
-
-    def test_successful_weather_request(self):
+    @pytest.fixture(scope="class")
+    def weather(self):
+        """Fixture to share one Weather instance across the class."""
+        return Weather()
+
+    @pytest.fixture(scope="class")
+    def london_response(self):
+        """Canned London response, built once and shared by the constant scenarios."""
+        return StubResponse(200, _WEATHER_TEMPLATE)
+
+    @pytest.fixture(scope="class")
+    def _class_get(self, weather):
+        """Swap the API client's get for a Mock once per class and restore it after."""
+        with pytest.MonkeyPatch.context() as mp:
+            mock = Mock()
+            mp.setattr(weather.apiClient, "get", mock)
+            yield mock
+
+    @pytest.fixture
+    def mock_get(self, _class_get):
+        """Provide the class's get Mock with calls and configured returns cleared."""
+        _class_get.reset_mock(return_value=True, side_effect=True)
+        return _class_get
+
+    def test_successful_weather_request(self, weather, mock_get, london_response):
         """Test successful weather data retrieval."""
-        json_data = {
-            "name": "London",
-            "weather": [{"id": 800, "main": "Clear", "description": "clear sky"}],
-            "main": {
-                "temp": 288.15,
-                "pressure": 1013,
-                "humidity": 65,
-                "temp_min": 287.15,
-                "temp_max": 289.15,
-            },
-            "wind": {"speed": 3.5, "deg": 180},
-            "clouds": {"all": 20},
-            "sys": {"country": "GB", "sunrise": 1640000000, "sunset": 1640030000},
-            "cod": 200,
-        }
-
-        with patch.object(
-            self.weather.apiClient,
-            "get",
-            return_value=self._mock_response(200, json_data),
-        ):
-            result = self.weather.execute({"city": "London"})
-            assert "15.0°C" in result
-            assert "clear sky" in result
+        mock_get.return_value = london_response
+        result = weather.execute({"city": "London"})
+        assert "15.0°C" in result
+        assert "clear sky" in result
 
     @pytest.mark.parametrize(
         "city, temp_kelvin, description",
@@ -64,64 +128,46 @@ class TestWeather:
             ("New York", 285.15, "rainy"),
         ],
     )
-    def test_weather_with_different_cities(self, city, temp_kelvin, description):
+    def test_weather_with_different_cities(
+        self, weather, mock_get, city, temp_kelvin, description
+    ):
         """Test weather requests for multiple cities."""
         json_data = {
-            "name": city,
-            "weather": [{"id": 800, "main": "Clear", "description": description}],
-            "main": {
-                "temp": temp_kelvin,
-                "pressure": 1013,
-                "humidity": 60,
-                "temp_min": temp_kelvin - 2,
-                "temp_max": temp_kelvin + 2,
-            },
+            **_weather_json(city, temp_kelvin, description, humidity=60, spread=2),
             "wind": {"speed": 2.5, "deg": 90},
             "clouds": {"all": 10},
-            "sys": {"country": "XX", "sunrise": 1640000000, "sunset": 1640030000},
-            "cod": 200,
+            "sys": {**_WEATHER_TEMPLATE["sys"], "country": "XX"},
         }
-        with patch.object(
-            self.weather.apiClient,
-            "get",
-            return_value=self._mock_response(200, json_data),
-        ):
-            result = self.weather.execute({"city": city})
-            expected_temp = round(temp_kelvin - 273.15, 1)
-            assert f"{expected_temp}°C" in result
-            assert description in result
+        mock_get.return_value = StubResponse(200, json_data)
+        result = weather.execute({"city": city})
+        expected_temp = round(temp_kelvin - 273.15, 1)
+        assert f"{expected_temp}°C" in result
+        assert description in result
 
     @pytest.mark.parametrize(
         "params, expected_error, match",
         [
-            ({}, WeatherRequestError, "City parameter is required"),
-            ({"city": ""}, WeatherRequestError, "City name cannot be empty"),
-            ({"city": "   "}, WeatherRequestError, "City name cannot be empty"),
+            ({}, WeatherRequestError, _CITY_REQUIRED_RE),
+            ({"city": ""}, WeatherRequestError, _CITY_EMPTY_RE),
+            ({"city": "   "}, WeatherRequestError, _CITY_EMPTY_RE),
         ],
     )
-    def test_invalid_city_inputs(self, params, expected_error, match):
+    def test_invalid_city_inputs(self, weather, params, expected_error, match):
         """Test missing, empty, and whitespace-only city names."""
         with pytest.raises(expected_error, match=match):
-            self.weather.execute(params)
+            weather.execute(params)
 
-    def test_city_not_found(self):
+    def test_city_not_found(self, weather, mock_get):
         """Test error when city is not found."""
-        with patch.object(
-            self.weather.apiClient,
-            "get",
-            return_value=self._mock_response(404, text="city not found"),
-        ):
-            with pytest.raises(CityNotFoundError, match="City 'InvalidCity' not found"):
-                self.weather.execute({"city": "InvalidCity"})
-
-    def test_api_key_missing(self):
+        mock_get.return_value = StubResponse(404, text="city not found")
+        with pytest.raises(CityNotFoundError, match=_CITY_NOT_FOUND_RE):
+            weather.execute({"city": "InvalidCity"})
+
+    def test_api_key_missing(self, monkeypatch):
         """Test error when API key is missing."""
-        with patch.dict("os.environ", {}, clear=True):
-            with pytest.raises(
-                WeatherConfigurationError,
-                match="WEATHER_API_KEY environment variable is required",
-            ):
-                Weather()
+        monkeypatch.delenv("WEATHER_API_KEY", raising=False)
+        with pytest.raises(WeatherConfigurationError, match=_API_KEY_REQUIRED_RE):
+            Weather()
 
     @pytest.mark.parametrize(
         "status_code, text",
@@ -130,115 +176,52 @@ class TestWeather:
             (401, "Invalid API key"),
         ],
     )
-    def test_api_error_responses(self, status_code, text):
+    def test_api_error_responses(self, weather, mock_get, status_code, text):
         """Test handling of API server and unauthorized errors."""
-        with patch.object(
-            self.weather.apiClient,
-            "get",
-            return_value=self._mock_response(status_code, text=text),
-        ):
-            with pytest.raises(WeatherAPIError, match="Weather API error"):
-                self.weather.execute({"city": "London"})
-
-    def test_malformed_api_response(self):
+        mock_get.return_value = StubResponse(status_code, text=text)
+        with pytest.raises(WeatherAPIError, match=_API_ERROR_RE):
+            weather.execute({"city": "London"})
+
+    def test_malformed_api_response(self, weather, mock_get):
         """Test handling of malformed API responses."""
-        bad_json = {"invalid": "response"}
-        with patch.object(
-            self.weather.apiClient,
-            "get",
-            return_value=self._mock_response(200, bad_json),
-        ):
-            with pytest.raises(WeatherAPIError, match="Invalid weather data format"):
-                self.weather.execute({"city": "London"})
-
-    def test_network_error(self):
+        mock_get.return_value = StubResponse(200, _MALFORMED)
+        with pytest.raises(WeatherAPIError, match=_INVALID_FORMAT_RE):
+            weather.execute({"city": "London"})
+
+    def test_network_error(self, weather, mock_get):
         """Test handling of network errors."""
-        with patch.object(
-            self.weather.apiClient, "get", side_effect=Exception("Network error")
-        ):
-            with pytest.raises(WeatherAPIError, match="Weather request failed"):
-                self.weather.execute({"city": "London"})
+        mock_get.side_effect = Exception("Network error")
+        with pytest.raises(WeatherAPIError, match=_REQUEST_FAILED_RE):
+            weather.execute({"city": "London"})
 
-    def test_weather_with_optional_fields_missing(self):
+    def test_weather_with_optional_fields_missing(self, weather, mock_get):
         """Test weather response when optional fields are missing."""
-        json_data = {
-            "name": "TestCity",
-            "weather": [{"id": 800, "main": "Clear", "description": "clear sky"}],
-            "main": {
-                "temp": 288.15,
-                "pressure": 1013,
-                "humidity": 65,
-                "temp_min": 287.15,
-                "temp_max": 289.15,
-            },
-            "sys": {"country": "XX", "sunrise": 1640000000, "sunset": 1640030000},
-            "cod": 200,
-        }
-        with patch.object(
-            self.weather.apiClient,
-            "get",
-            return_value=self._mock_response(200, json_data),
-        ):
-            result = self.weather.execute({"city": "TestCity"})
-            assert "15.0°C" in result
-            assert "clear sky" in result
-
-    @pytest.mark.parametrize(
-        "temp_kelvin, expected_celsius",
-        [
-            (233.15, -40.0),
-            (323.15, 50.0),
-            (273.15, 0.0),
-        ],
+        mock_get.return_value = StubResponse(200, _OPTIONAL_FIELDS_MISSING)
+        result = weather.execute({"city": "TestCity"})
+        assert "15.0°C" in result
+        assert "clear sky" in result
+
+    @pytest.fixture(
+        params=[(233.15, -40.0), (323.15, 50.0), (273.15, 0.0)],
+        ids=["freezing", "scorching", "zero_celsius"],
     )
-    def test_extreme_temperatures(self, temp_kelvin, expected_celsius):
+    def extreme_case(self, request, mock_get):
+        """Serve the cached response for an extreme temperature; yield its Celsius."""
+        temp_kelvin, expected_celsius = request.param
+        mock_get.return_value = _response_for(temp_kelvin)
+        return expected_celsius
+
+    def test_extreme_temperatures(self, weather, extreme_case):
         """Test weather with extreme temperature values."""
-        json_data = {
-            "name": "ExtremeCity",
-            "weather": [{"id": 800, "main": "Clear", "description": "clear"}],
-            "main": {
-                "temp": temp_kelvin,
-                "pressure": 1013,
-                "humidity": 50,
-                "temp_min": temp_kelvin - 1,
-                "temp_max": temp_kelvin + 1,
-            },
-            "wind": {"speed": 1.0, "deg": 0},
-            "clouds": {"all": 0},
-            "sys": {"country": "XX", "sunrise": 1640000000, "sunset": 1640030000},
-            "cod": 200,
-        }
-        with patch.object(
-            self.weather.apiClient,
-            "get",
-            return_value=self._mock_response(200, json_data),
-        ):
-            result = self.weather.execute({"city": "ExtremeCity"})
-            assert f"{expected_celsius}°C" in result
+        result = weather.execute({"city": "ExtremeCity"})
+        assert f"{extreme_case}°C" in result
 
     @pytest.mark.parametrize("city_name", ["london", "LONDON", "London", "LoNdOn"])
-    def test_city_name_case_insensitive(self, city_name):
+    def test_city_name_case_insensitive(
+        self, weather, mock_get, city_name, london_response
+    ):
         """Test that city names are handled case-insensitively."""
-        json_data = {
-            "name": "London",
-            "weather": [{"id": 800, "main": "Clear", "description": "clear sky"}],
-            "main": {
-                "temp": 288.15,
-                "pressure": 1013,
-                "humidity": 65,
-                "temp_min": 287.15,
-                "temp_max": 289.15,
-            },
-            "wind": {"speed": 3.5, "deg": 180},
-            "clouds": {"all": 20},
-            "sys": {"country": "GB", "sunrise": 1640000000, "sunset": 1640030000},
-            "cod": 200,
-        }
-        with patch.object(
-            self.weather.apiClient,
-            "get",
-            return_value=self._mock_response(200, json_data),
-        ):
-            result = self.weather.execute({"city": city_name})
-            assert "15.0°C" in result
-            assert "clear sky" in result
+        mock_get.return_value = london_response
+        result = weather.execute({"city": city_name})
+        assert "15.0°C" in result
+        assert "clear sky" in result
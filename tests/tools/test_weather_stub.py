@@ -6,15 +6,25 @@ from tests.utils.constants.weather import (CITY_TEMPERATURE,
                                            DEFAULT_WEATHER_METADATA)
 from tests.utils.stubs.tools.weather import MockWeather
 
+# City temperatures in Celsius, indexed once by lowercase and by title-case name
+_CITY_TEMP_LC = {city.lower(): float(temp) for city, temp in CITY_TEMPERATURE.items()}
+_CITY_TEMP_TITLE = {
+    city.title(): float(temp) for city, temp in CITY_TEMPERATURE.items()
+}
 
-@pytest.mark.usefixtures("weather_fixture")
+_EXPECTED_KEYS = frozenset(
+    {"raw", "response", "temp_c", "humidity", "description", "wind_speed", "city"}
+)
+
+
+@pytest.mark.fast
 class TestWeatherStub:
     """Test suite for Weather stub tool."""
 
-    @pytest.fixture(autouse=True)
-    def weather_fixture(self):
-        """Fixture that provides a MockWeather instance for each test."""
-        self.mock_weather = MockWeather()
+    @pytest.fixture(scope="class")
+    def mock_weather(self):
+        """Fixture to share one MockWeather across the class; it holds no state."""
+        return MockWeather()
 
     @pytest.mark.parametrize(
         "city, expected",
@@ -57,9 +67,9 @@ class TestWeatherStub:
             ),
         ],
     )
-    def test_known_cities(self, city, expected):
+    def test_known_cities(self, mock_weather, city, expected):
         """Test weather stub for known cities."""
-        result = self.mock_weather.execute({"city": city})
+        result = mock_weather.execute({"city": city})
 
         assert result["city"] == city
         assert result["temp_c"] == expected["temp_c"]
@@ -70,9 +80,9 @@ class TestWeatherStub:
             f"{expected['temp_c']}°C, {expected['description']}" in result["response"]
         )
 
-    def test_unknown_city_uses_defaults(self):
+    def test_unknown_city_uses_defaults(self, mock_weather):
         """Test weather stub for unknown city uses default values."""
-        result = self.mock_weather.execute({"city": "UnknownCity"})
+        result = mock_weather.execute({"city": "UnknownCity"})
 
         assert result["city"] == "UnknownCity"
         for key, value in DEFAULT_WEATHER_METADATA.items():
@@ -82,36 +92,34 @@ class TestWeatherStub:
             in result["response"]
         )
 
-    @pytest.mark.parametrize("input_city", ["paris", "LONDON", "dHaKa", "AMSTERDAM"])
-    def test_case_insensitive_city_matching(self, input_city):
+    @pytest.mark.parametrize(
+        "input_city, expected_temp",
+        [
+            (city, _CITY_TEMP_LC[city.lower()])
+            for city in ("paris", "LONDON", "dHaKa", "AMSTERDAM")
+        ],
+    )
+    def test_case_insensitive_city_matching(
+        self, mock_weather, input_city, expected_temp
+    ):
         """Test that city matching is case insensitive."""
-        result = self.mock_weather.execute({"city": input_city})
+        result = mock_weather.execute({"city": input_city})
         assert result["city"] == input_city
-        assert result["temp_c"] == float(CITY_TEMPERATURE[input_city.lower()])
+        assert result["temp_c"] == expected_temp
 
-    def test_city_with_whitespace(self):
+    def test_city_with_whitespace(self, mock_weather):
         """Test city names with leading/trailing whitespace."""
-        result = self.mock_weather.execute({"city": "  Paris  "})
+        result = mock_weather.execute({"city": "  Paris  "})
 
         assert result["city"] == "Paris"
         assert result["temp_c"] == 18.0
         assert result["description"] == "cloudy and mild."
         assert "Paris" in result["response"]
 
-    def test_response_structure(self):
+    def test_response_structure(self, mock_weather):
         """Test that the response has the expected structure."""
-        result = self.mock_weather.execute({"city": "Paris"})
-        expected_keys = {
-            "raw",
-            "response",
-            "temp_c",
-            "humidity",
-            "description",
-            "wind_speed",
-            "city",
-        }
-
-        assert expected_keys.issubset(result.keys())
+        result = mock_weather.execute({"city": "Paris"})
+        assert _EXPECTED_KEYS <= result.keys()
         assert isinstance(result["temp_c"], float)
         assert isinstance(result["humidity"], int)
         assert isinstance(result["wind_speed"], float)
@@ -119,49 +127,58 @@ class TestWeatherStub:
         assert isinstance(result["response"], str)
         assert isinstance(result["city"], str)
 
-    def test_temperature_conversion_consistency(self):
+    def test_temperature_conversion_consistency(self, mock_weather):
         """Test that temperature conversion is consistent across all cities."""
-        for city_key, raw_temp in CITY_TEMPERATURE.items():
-            result = self.mock_weather.execute({"city": city_key.title()})
-            expected_temp = float(raw_temp)
+        for city, expected_temp in _CITY_TEMP_TITLE.items():
+            result = mock_weather.execute({"city": city})
             assert result["temp_c"] == expected_temp
             assert str(expected_temp) in result["response"]
 
-    def test_weather_response_format(self):
+    def test_weather_response_format(self, mock_weather):
         """Test that the weather response follows the expected format."""
-        result = self.mock_weather.execute({"city": "Paris"})
+        result = mock_weather.execute({"city": "Paris"})
         response = result["response"]
 
         assert "18.0°C" in response
         assert "cloudy and mild." in response
         assert "°C," in response
 
-    def test_metadata_fallback(self):
+    def test_metadata_fallback(self, mock_weather):
         """Test metadata fallback for cities with partial data."""
-        result = self.mock_weather.execute({"city": "UnknownTestCity"})
+        result = mock_weather.execute({"city": "UnknownTestCity"})
         for key, value in DEFAULT_WEATHER_METADATA.items():
             assert result[key] == value
 
-    def test_empty_city_name(self):
+    def test_empty_city_name(self, mock_weather):
         """Test behavior with empty city name."""
         with pytest.raises(ValueError, match="City name cannot be empty"):
-            self.mock_weather.execute({"city": ""})
+            mock_weather.execute({"city": ""})
 
     @pytest.mark.parametrize(
         "city, expected_temp",
         [("Paris", 18.0), ("London", 17.0), ("Amsterdam", 19.5)],
     )
-    def test_numeric_temperature_handling(self, city, expected_temp):
+    def test_numeric_temperature_handling(self, mock_weather, city, expected_temp):
         """Test that both string and numeric temperatures are handled correctly."""
-        result = self.mock_weather.execute({"city": city})
+        result = mock_weather.execute({"city": city})
         assert result["temp_c"] == expected_temp
 
-    def test_weather_response_object_structure(self):
+    def test_weather_response_object_structure(self, mock_weather):
         """Test that the WeatherResponse object is properly structured."""
-        result = self.mock_weather.execute({"city": "Paris"})
+        result = mock_weather.execute({"city": "Paris"})
         response_text = result["response"]
 
         assert isinstance(response_text, str)
         assert len(response_text) > 0
         assert "18.0°C" in response_text
         assert "cloudy and mild." in response_text
+
+    def test_repeated_calls_return_fresh_copies(self, mock_weather):
+        """Test that cached city payloads are not shared between calls."""
+        first = mock_weather.execute({"city": "Paris"})
+        first["temp_c"] = -1
+        second = mock_weather.execute({"city": "paris"})
+
+        assert second["temp_c"] == 18.0
+        assert second["city"] == "paris"
+        assert second["response"] == first["response"]
@@ -0,0 +1,27 @@
+"""Constants for LLM strategy testing"""
+
+import copy
+import re
+
+GEMINI_OK = {"candidates": [{"content": {"parts": [{"text": None}]}}]}
+
+OPENAI_OK = {"output": [{"content": [{"type": "output_text", "text": None}]}]}
+
+# Static sections must precede the user prompt so providers can cache the prefix.
+PROMPT_RE = re.compile(
+    r"Role:.*Context:.*Response Format:.*JSON.*Prompt: What is 2\+2\?", re.DOTALL
+)
+
+
+def gemini_payload(text):
+    """Clone the canonical Gemini response and fill in the text part."""
+    payload = copy.deepcopy(GEMINI_OK)
+    payload["candidates"][0]["content"]["parts"][0]["text"] = text
+    return payload
+
+
+def openai_payload(text):
+    """Clone the canonical OpenAI response and fill in the output text."""
+    payload = copy.deepcopy(OPENAI_OK)
+    payload["output"][0]["content"][0]["text"] = text
+    return payload
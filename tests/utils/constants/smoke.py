@@ -0,0 +1,20 @@
+"""Constants for agent smoke testing"""
+
+import re
+
+NUMBER_RE = re.compile(r"\d+\.?\d*")
+
+
+# Words an LLM answer uses when it declines or could not complete the request.
+APOLOGY_WORDS = frozenset({"unable", "sorry"})
+FAILURE_WORDS = APOLOGY_WORDS | {"error", "failed"}
+
+
+def keyword_pattern(*keywords):
+    """Compile a case-insensitive pattern matching any keyword as a substring."""
+    pattern = "|".join(map(re.escape, sorted(keywords)))
+    return re.compile(pattern, re.IGNORECASE)
+
+
+FAILURE_RE = keyword_pattern(*FAILURE_WORDS)
+FAILURE_OR_TEMPERATURE_RE = keyword_pattern(*FAILURE_WORDS, "temperature")
@@ -2,6 +2,8 @@
 
 CITY_TEMPERATURE = {"paris": "18", "london": 17.0, "dhaka": 31, "amsterdam": "19.5"}
 
+CITY_KEYS = frozenset(city.lower() for city in CITY_TEMPERATURE)
+
 WEATHER_METADATA = {
     "paris": {"description": "cloudy and mild.", "humidity": 60, "wind_speed": 3.2},
     "london": {"description": "cold and rainy.", "humidity": 70, "wind_speed": 4.1},
@@ -1,14 +1,23 @@
 """AgentStub that utilizes the StubToolInvoker/StubLLMStrategy"""
 
 import re
-from typing import Any, Dict, List
+from graphlib import CycleError, TopologicalSorter
+from typing import Dict, List
 
 from src.constants.messages import FAILED_AGENT_MESSAGE
+from src.data.schemas.tools.tool_response import ToolResponse
 from src.lib.agents.base import Agent
 
 from .llm import StubLLMStrategy
 from .tools.invoker import StubToolInvoker
 
+_RE_FIRST_NUMBER = re.compile(r"(-?\d+(?:\.\d+)?)\s*(?:°\s*C|°C|C|F)?")
+_RE_WEATHER_CITY = re.compile(r"Weather\s+in\s+([A-Za-z\s]+):", re.IGNORECASE)
+_RE_TEMP_PLACEHOLDER = re.compile(r"\b[A-Za-z_]+_temp\b", re.IGNORECASE)
+
+_TEMP_KEYWORDS = ("temperature", "weather")
+_WEATHER_KEYWORDS = ("summary", "weather", "summarize")
+
 
 class AgentStub(Agent):
     """Test-oriented Agent that resolves simple calculator dependencies using stub outputs."""
@@ -21,7 +30,7 @@ class AgentStub(Agent):
         """Extract the first numeric value (int/float) from a string."""
         if not s or not isinstance(s, str):
             return None
-        match = re.search(r"(-?\d+(?:\.\d+)?)\s*(?:°\s*C|°C|C|F)?", s)
+        match = _RE_FIRST_NUMBER.search(s)
         if match:
             try:
                 return float(match.group(1))
@@ -29,29 +38,15 @@ class AgentStub(Agent):
                 return None
         return None
 
-    def _execute_single_tool(self, suggestion) -> Dict[str, Any]:
-        """Execute a single tool and return a standardized response."""
-        tool_name = getattr(suggestion, "tool", None) or getattr(
-            suggestion, "tool_name", None
+    def _execute_single_tool(self, suggestion) -> ToolResponse:
+        """Execute a single tool, filling in a fallback result if it fails."""
+        self.tool_invoker.set_action(suggestion.tool)
+        response = self.tool_invoker.execute(suggestion.args)
+        if response.success:
+            return response
+        return response._replace(
+            result=self._fallback_result(suggestion.tool, suggestion.args)
         )
-        if not tool_name:
-            return {"tool": None, "args": {}, "success": False, "result": None}
-
-        args = getattr(suggestion, "args", {}) or {}
-        self.tool_invoker.set_action(tool_name)
-
-        try:
-            result = self.tool_invoker.execute(args)
-            return {"tool": tool_name, "args": args, "success": True, "result": result}
-        except Exception as e:
-            result = None
-
-        return {
-            "tool": tool_name,
-            "args": args,
-            "success": False,
-            "result": self._fallback_result(tool_name, args),
-        }
 
     @staticmethod
     def _fallback_result(tool_name: str, args: dict) -> str:
@@ -66,112 +61,133 @@ class AgentStub(Agent):
             return f"Result for query: {query}"
         return "OK"
 
-    def execute_tools(self, tool_plan) -> List[Dict[str, Any]]:
-        """
-        Execute tools in two passes:
-         1. Execute non-dependent tools immediately.
-         2. Resolve calculator dependencies using extracted context.
-         3. Re-run if dependencies remain.
+    def execute_tools(self, tool_plan) -> List[ToolResponse]:
         """
-        responses, deferred_calcs = self._run_initial_tools(tool_plan)
-        context = self._build_weather_context(responses)
+        Execute tools in dependency order.
 
-        executed_calcs = self._run_calculators(deferred_calcs, context, responses)
-        responses.extend(executed_calcs)
+        Calculators are scheduled after the weather lookups their ``<city>_temp``
+        placeholders (or ``depends_on`` tools) refer to, and the placeholders are
+        filled in from the weather results just before each calculator runs.
+        A cyclic plan falls back to plan order.
+        """
+        suggestions = tool_plan.suggestions
+        sorter = TopologicalSorter()
+        for index, prerequisites in enumerate(self._prerequisites(suggestions)):
+            sorter.add(index, *prerequisites)
+        try:
+            order = list(sorter.static_order())
+        except CycleError:
+            order = list(range(len(suggestions)))
+
+        responses, context = [], {}
+        for index in order:
+            suggestion = suggestions[index]
+            if suggestion.tool == "calculator" and context:
+                expr = suggestion.args.get("expr", "")
+                suggestion.args = {"expr": self._substitute_context(expr, context)}
+            response = self._execute_single_tool(suggestion)
+            responses.append(response)
+            context.update(self._build_weather_context([response]))
         return responses
 
-    def _run_initial_tools(self, tool_plan):
-        """Run tools that don't have dependencies and collect deferred calculators."""
-        responses, deferred_calcs = [], []
-        for suggestion in tool_plan.suggestions:
-            is_calc = suggestion.tool == "calculator"
-            has_deps = bool(getattr(suggestion, "depends_on", []) or [])
-            if is_calc and has_deps:
-                deferred_calcs.append(suggestion)
-            else:
-                responses.append(self._execute_single_tool(suggestion))
-        return responses, deferred_calcs
+    @staticmethod
+    def _prerequisites(suggestions) -> List[List[int]]:
+        """List, per suggestion, the indices of the suggestions it must run after."""
+        by_tool: Dict[str, List[int]] = {}
+        by_placeholder: Dict[str, List[int]] = {}
+        for index, suggestion in enumerate(suggestions):
+            by_tool.setdefault(suggestion.tool, []).append(index)
+            if suggestion.tool == "weather":
+                city = str(suggestion.args.get("city", "")).strip().lower()
+                by_placeholder.setdefault(f"{city}_temp", []).append(index)
+
+        prerequisites: List[List[int]] = []
+        for index, suggestion in enumerate(suggestions):
+            before: set[int] = set()
+            if suggestion.tool == "calculator":
+                for tool in suggestion.depends_on:
+                    before.update(by_tool.get(tool, ()))
+                expr = str(suggestion.args.get("expr", ""))
+                for placeholder in _RE_TEMP_PLACEHOLDER.findall(expr):
+                    before.update(by_placeholder.get(placeholder.lower(), ()))
+                before.discard(index)
+            prerequisites.append(sorted(before))
+        return prerequisites
 
     def _build_weather_context(self, responses):
-        """Extract weather data to a lookup dict for calculators."""
+        """Extract weather data to a lookup dict keyed by lowercase ``<city>_temp``."""
         context = {}
         for r in responses:
-            if r.get("tool") != "weather" or not r.get("success"):
+            if r.tool != "weather" or not r.success:
                 continue
-            result = r.get("result")
+            result = r.result
             city = self._extract_city(r) or None
             if city:
                 temp = self._extract_first_number(str(result))
                 if temp is not None:
-                    key_base = city.strip()
-                    context[f"{key_base.lower()}_temp"] = temp
-                    context[f"{key_base.title()}_temp"] = temp
+                    context[f"{city.strip().lower()}_temp"] = temp
         return context
 
     @staticmethod
     def _extract_city(response) -> str | None:
         """Extract city name from response args or result string."""
-        args = response.get("args") or {}
+        args = response.args or {}
         if isinstance(args, dict) and args.get("city"):
             return args.get("city")
 
-        result_str = response.get("result")
+        result_str = response.result
         if isinstance(result_str, str):
-            match = re.search(
-                r"Weather\s+in\s+([A-Za-z\s]+):", result_str, re.IGNORECASE
-            )
+            match = _RE_WEATHER_CITY.search(result_str)
             if match:
                 return match.group(1).strip()
         return None
 
-    def _run_calculators(self, calculators, context, existing_responses):
-        """Substitute context values into calculator expressions and execute."""
-        executed, deferred = [], []
-        for calc in calculators:
-            expr = self._substitute_context(calc.args.get("expr", ""), context)
-            if re.search(r"[A-Za-z_]+_temp", expr):
-                deferred.append(calc)
-                continue
-            calc.args = {"expr": expr}
-            executed.append(self._execute_single_tool(calc))
-
-        if deferred:
-            new_plan = self._evaluate_calculator_dependencies(
-                existing_responses + executed
-            )
-            if new_plan and getattr(new_plan, "suggestions", []):
-                executed.extend(self.execute_tools(new_plan))
-        return executed
-
     @staticmethod
     def _substitute_context(expr: str, context: dict) -> str:
-        """Replace placeholders in a calculator expression with numeric values."""
+        """
+        Replace placeholders in a calculator expression with numeric values.
+        Context keys are lowercase; placeholders match regardless of case.
+        """
         expr = str(expr)
-        for placeholder, value in context.items():
-            expr = re.sub(
-                rf"\b{re.escape(placeholder)}\b", str(value), expr, flags=re.IGNORECASE
-            )
-        return expr
+        if not context:
+            return expr
 
-    def fuse_responses(self, responses: List[Dict[str, Any]], query: str) -> str:
+        def _value(match: re.Match) -> str:
+            placeholder = match.group(0)
+            return str(context.get(placeholder.lower(), placeholder))
+
+        return _RE_TEMP_PLACEHOLDER.sub(_value, expr)
+
+    def fuse_responses(self, responses: List[ToolResponse], query: str) -> str:
         """Combine tool responses into a final answer."""
         try:
             if not responses:
                 return "No valid responses from tools."
 
-            successful = [r for r in responses if r.get("success")]
+            successful, by_tool = [], {}
+            for r in responses:
+                if r.success:
+                    successful.append(r)
+                    by_tool.setdefault(r.tool, []).append(r)
             if not successful:
                 return "No valid responses from tools."
 
-            calculator_response = self._get_last_calculator_result(successful, query)
+            query_lc = query.lower()
+            calculator_response = self._get_last_calculator_result(
+                by_tool.get("calculator", []), query_lc
+            )
             if calculator_response:
                 return calculator_response
 
-            weather_response = self._get_weather_responses(successful, query)
+            weather_response = self._get_weather_responses(
+                by_tool.get("weather", []), query_lc
+            )
             if weather_response:
                 return weather_response
 
-            knowledge_base_response = self._get_knowledge_responses(successful)
+            knowledge_base_response = self._get_knowledge_responses(
+                by_tool.get("knowledge_base", [])
+            )
             if knowledge_base_response:
                 return knowledge_base_response
 
@@ -180,40 +196,33 @@ class AgentStub(Agent):
         except Exception:
             return FAILED_AGENT_MESSAGE
 
-    def _get_last_calculator_result(self, responses, query):
-        calc_results = [
-            r
-            for r in responses
-            if r.get("tool") == "calculator" and r.get("result") is not None
-        ]
-        if not calc_results:
+    def _get_last_calculator_result(self, calc_responses, query_lc):
+        last = next((r for r in reversed(calc_responses) if r.result is not None), None)
+        if last is None:
             return None
-        val = str(calc_results[-1]["result"])
-        if any(
-            k in query.lower() for k in ["temperature", "weather"]
-        ) and not val.endswith("°C"):
+        val = str(last.result)
+        if any(k in query_lc for k in _TEMP_KEYWORDS) and not val.endswith("°C"):
             val = f"{val}°C"
         return val
 
     @staticmethod
-    def _get_weather_responses(responses, query):
-        weather_results = [r for r in responses if r.get("tool") == "weather"]
-        if not weather_results:
+    def _get_weather_responses(weather_responses, query_lc):
+        if not weather_responses:
             return None
         formatted = []
-        for r in weather_results:
-            args, res = r.get("args", {}), r.get("result")
+        for r in weather_responses:
+            args, res = r.args, r.result
             city = args.get("city") if isinstance(args, dict) else None
-            formatted.append(AgentStub._format_weather_response(city, res, query))
+            formatted.append(AgentStub._format_weather_response(city, res, query_lc))
         return "; ".join(formatted)
 
     @staticmethod
-    def _format_weather_response(city, res, query):
+    def _format_weather_response(city, res, query_lc):
         if not city:
             return str(res)
-        q = query.lower()
+        q = query_lc
         if isinstance(res, dict):
-            if "summary" in q or "weather" in q or "summarize" in q:
+            if any(k in q for k in _WEATHER_KEYWORDS):
                 return res.get("description", str(res))
             if "temperature" in q:
                 return f"{res.get('temp_c', '?')}°C"
@@ -224,17 +233,14 @@ class AgentStub(Agent):
         return f"{str(city).title()}: {str(res)}"
 
     @staticmethod
-    def _get_knowledge_responses(responses):
-        kb_results = [r for r in responses if r.get("tool") == "knowledge_base"]
-        if kb_results:
-            return kb_results[0]["result"].summary
+    def _get_knowledge_responses(kb_responses):
+        if kb_responses:
+            return kb_responses[0].result.summary
         return None
 
     @staticmethod
     def _format_generic_responses(responses):
-        results = [
-            str(r.get("result")) for r in responses if r.get("result") is not None
-        ]
+        results = [str(r.result) for r in responses if r.result is not None]
         if not results:
             return "No valid responses from tools."
         return (
@@ -3,25 +3,83 @@ StubLLMStrategy Implementation
 Handles Calculator, Weather, KnowledgeBase, CurrencyConverter.
 """
 
+import ast
+import functools
 import math
+import operator
 import re
 from typing import Optional
 
-from src.data.schemas.tools.tool import (CalculatorArgs, CurrencyConverterArgs,
-                                         KnowledgeBaseArgs, ToolPlan,
-                                         ToolSuggestion, WeatherArgs)
+from src.data.schemas.tools.tool import ToolPlan, ToolSuggestion
 from src.lib.llm.base import LLMStrategy
 from tests.utils.constants.calculator import OPERATOR_PATTERNS
-from tests.utils.constants.weather import CITY_TEMPERATURE
-
-
+from tests.utils.constants.weather import CITY_KEYS, CITY_TEMPERATURE
+
+_RE_QUERY_PREFIX = re.compile(
+    r"^(?:what is|calculate|compute|please|find|the result of)\s*", re.IGNORECASE
+)
+_RE_ARITHMETIC = re.compile(r"([0-9\s\+\-\*/\.%\(\)]+)")
+_RE_ADD_NUMBERS = re.compile(
+    r"add\s+([0-9]+(?:\.[0-9]+)?)\s+(?:and|to)\s+([0-9]+(?:\.[0-9]+)?)",
+    re.IGNORECASE,
+)
+_RE_KNOWLEDGE_QUERY = re.compile(
+    r"(?:who\s+is|tell\s+me\s+about|what\s+is)\s+([A-Za-z\s]+?)[\?\.!]*$",
+    re.IGNORECASE,
+)
+_RE_CURRENCY_AVERAGE = re.compile(
+    r"average of (\d+(?:\.\d+)?) and (\d+(?:\.\d+)?) (USD|EUR) into (USD|EUR)",
+    re.IGNORECASE,
+)
+_RE_CURRENCY_CONVERT = re.compile(
+    r"convert (\d+(?:\.\d+)?) (USD|EUR) to (USD|EUR)", re.IGNORECASE
+)
+_RE_AVERAGE_ADD = re.compile(
+    r"add\s+([0-9]+(?:\.[0-9]+)?)\s+to\s+the\s+average\s+(?:temperature\s+)?(?:in\s+)?([A-Za-z]+)\s*(?:and|,)\s*([A-Za-z]+)",
+    re.IGNORECASE,
+)
+
+# Single pass over the prompt for every known city, longest names first.
+_RE_CITIES = re.compile(
+    "|".join(re.escape(city) for city in sorted(CITY_KEYS, key=len, reverse=True))
+)
+
+
+_BINARY_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+_UNARY_OPS = {ast.UAdd: operator.pos, ast.USub: operator.neg}
+_FUNCTIONS = {"sqrt": math.sqrt, "pow": pow}
+
+
+def _evaluate(node: ast.expr) -> float:
+    """Walk an arithmetic AST, allowing only numbers, operators, sqrt and pow."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return node.value
+    if isinstance(node, ast.BinOp):
+        return _BINARY_OPS[type(node.op)](_evaluate(node.left), _evaluate(node.right))
+    if isinstance(node, ast.UnaryOp):
+        return _UNARY_OPS[type(node.op)](_evaluate(node.operand))
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+        return _FUNCTIONS[node.func.id](*(_evaluate(arg) for arg in node.args))
+    raise ValueError(f"Unsupported expression: {ast.dump(node)}")
+
+
+@functools.lru_cache(maxsize=256)
 def safe_eval(expr: str) -> Optional[float]:
+    """Evaluate an arithmetic expression; results are memoised per expression."""
     try:
-        return eval(expr, {"__builtins__": {}}, {"sqrt": math.sqrt, "pow": pow})
+        return _evaluate(ast.parse(expr, mode="eval").body)
     except Exception:
         return None
 
 
+@functools.lru_cache(maxsize=512)
 def extract_expression(prompt: str) -> Optional[str]:
     """
     Extract a numeric expression from a prompt string.
@@ -32,12 +90,7 @@ def extract_expression(prompt: str) -> Optional[str]:
     - Basic arithmetic: "1 + 1"
     - 'add X and Y' / 'add X to Y'
     """
-    cleaned_prompt = re.sub(
-        r"^(?:what is|calculate|compute|please|find|the result of)\s*",
-        "",
-        prompt,
-        flags=re.IGNORECASE,
-    ).strip()
+    cleaned_prompt = _RE_QUERY_PREFIX.sub("", prompt).strip()
 
     for pat in OPERATOR_PATTERNS:
         m = pat.search(cleaned_prompt)
@@ -47,55 +100,42 @@ def extract_expression(prompt: str) -> Optional[str]:
             if "^" in m.group(0):
                 return f"{m.group(1)}**{m.group(2)}"
 
-    m = re.search(r"([0-9\s\+\-\*/\.%\(\)]+)", cleaned_prompt)
+    m = _RE_ARITHMETIC.search(cleaned_prompt)
     if m:
         return m.group(1).strip()
 
-    m = re.search(
-        r"add\s+([0-9]+(?:\.[0-9]+)?)\s+(?:and|to)\s+([0-9]+(?:\.[0-9]+)?)",
-        cleaned_prompt,
-        re.IGNORECASE,
-    )
+    m = _RE_ADD_NUMBERS.search(cleaned_prompt)
     if m:
         return f"{m.group(1)} + {m.group(2)}"
 
     return None
 
 
-def extract_cities(prompt: str) -> list[str]:
-    cities = []
-    for city in CITY_TEMPERATURE:
-        if city in prompt.lower():
-            cities.append(city)
-    return cities
+@functools.lru_cache(maxsize=512)
+def extract_cities(prompt: str) -> tuple[str, ...]:
+    found = set(_RE_CITIES.findall(prompt.lower()))
+    if not found:
+        return ()
+    return tuple(city for city in CITY_TEMPERATURE if city in found)
 
 
+@functools.lru_cache(maxsize=512)
 def extract_knowledge_base_query(prompt: str) -> Optional[str]:
-    pat = re.compile(
-        r"(?:who\s+is|tell\s+me\s+about|what\s+is)\s+([A-Za-z\s]+?)[\?\.!]*$",
-        re.IGNORECASE,
-    )
-    m = pat.search(prompt.strip())
+    m = _RE_KNOWLEDGE_QUERY.search(prompt.strip())
     if m:
         return m.group(1).strip().lower()
     return None
 
 
 def extract_currency_conversion(prompt: str):
-    m = re.search(
-        r"average of (\d+(?:\.\d+)?) and (\d+(?:\.\d+)?) (USD|EUR) into (USD|EUR)",
-        prompt,
-        re.IGNORECASE,
-    )
+    m = _RE_CURRENCY_AVERAGE.search(prompt)
     if m:
         return (
             m.group(3).upper(),
             m.group(4).upper(),
             (float(m.group(1)) + float(m.group(2))) / 2,
         )
-    m = re.search(
-        r"convert (\d+(?:\.\d+)?) (USD|EUR) to (USD|EUR)", prompt, re.IGNORECASE
-    )
+    m = _RE_CURRENCY_CONVERT.search(prompt)
     if m:
         return (m.group(2).upper(), m.group(3).upper(), float(m.group(1)))
 
@@ -115,37 +155,23 @@ class StubLLMStrategy(LLMStrategy):
             expr = expr.strip()
             if expr:
                 suggestions.append(
-                    ToolSuggestion(
-                        tool="calculator", args=CalculatorArgs(expr=expr).model_dump()
-                    )
+                    ToolSuggestion(tool="calculator", args={"expr": expr})
                 )
-                cities = extract_cities(prompt)
         if cities:
             for c in cities:
                 suggestions.append(
-                    ToolSuggestion(
-                        tool="weather", args=WeatherArgs(city=c.title()).model_dump()
-                    )
+                    ToolSuggestion(tool="weather", args={"city": c.title()})
                 )
         if q:
-            suggestions.append(
-                ToolSuggestion(
-                    tool="knowledge_base", args=KnowledgeBaseArgs(query=q).model_dump()
-                )
-            )
+            suggestions.append(ToolSuggestion(tool="knowledge_base", args={"query": q}))
 
-        m_avg_add = re.search(
-            r"add\s+([0-9]+(?:\.[0-9]+)?)\s+to\s+the\s+average\s+(?:temperature\s+)?(?:in\s+)?([A-Za-z]+)\s*(?:and|,)\s*([A-Za-z]+)",
-            prompt,
-            re.IGNORECASE,
-        )
+        m_avg_add = _RE_AVERAGE_ADD.search(prompt)
         if m_avg_add:
             add_val, c1, c2 = m_avg_add.groups()
             expr = f"({c1}_temp + {c2}_temp) / 2 + {add_val}"
-            calc_args = CalculatorArgs(expr=expr).model_dump()
             suggestions.append(
                 ToolSuggestion(
-                    tool="calculator", args=calc_args, depends_on=["weather"]
+                    tool="calculator", args={"expr": expr}, depends_on=["weather"]
                 )
             )
 
@@ -155,9 +181,7 @@ class StubLLMStrategy(LLMStrategy):
             suggestions.append(
                 ToolSuggestion(
                     tool="currency_converter",
-                    args=CurrencyConverterArgs(
-                        from_currency=src, to_currency=tgt, amount=amount
-                    ).model_dump(by_alias=True),
+                    args={"from": src, "to": tgt, "amount": amount},
                 )
             )
 
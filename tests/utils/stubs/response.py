@@ -0,0 +1,20 @@
+"""Stub for HTTP API Responses"""
+
+from typing import Any, Optional
+
+
+class StubResponse:
+    """
+    Minimal stand-in for the requests.Response attributes the tools read.
+    Unlike a Mock it creates no child mocks and records no calls.
+    """
+
+    __slots__ = ("status_code", "text", "_json")
+
+    def __init__(self, status_code: int = 200, json_data: Any = None, text: str = ""):
+        self.status_code = status_code
+        self.text = text
+        self._json = json_data
+
+    def json(self) -> Optional[Any]:
+        return self._json
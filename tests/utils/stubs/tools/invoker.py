@@ -3,7 +3,7 @@
 import time
 
 from src.constants.tools import Tool
-from src.lib.errors.tools.invoker import InvokerError
+from src.data.schemas.tools.tool_response import ToolResponse
 from src.lib.loggers import tool_logger
 from src.lib.tools.base import Action, ToolInvokerBase
 from src.lib.tools.calculator import Calculator
@@ -14,36 +14,56 @@ from .weather import MockWeather as Weather
 
 
 class StubToolInvoker(ToolInvokerBase):
+    _TOOL_CLS: dict[str, type[Action]] = {
+        Tool.CALCULATOR.value: Calculator,
+        Tool.WEATHER.value: Weather,
+        Tool.KNOWLEDGE_BASE.value: KnowledgeBase,
+        Tool.CURRENCY_CONVERTER.value: CurrencyConverter,
+    }
+
     def __init__(self):
         self._action: Action | None = None
         self._current_tool: str | None = None
+        # Tools hold no per-call state, so each one is built once per invoker.
+        self._cache: dict[str, Action] = {}
 
     def set_action(self, tool_type: str) -> None:
-        self._current_tool = tool_type
-        if tool_type == Tool.CALCULATOR.value:
-            self._action = Calculator()
-        elif tool_type == Tool.WEATHER.value:
-            self._action = Weather()
-        elif tool_type == Tool.KNOWLEDGE_BASE.value:
-            self._action = KnowledgeBase()
-        elif tool_type == Tool.CURRENCY_CONVERTER.value:
-            self._action = CurrencyConverter()
-        else:
+        tool_cls = self._TOOL_CLS.get(tool_type)
+        if tool_cls is None:
             raise ValueError(f"Unknown tool type: {tool_type}")
+        self._current_tool = tool_type
+        action = self._cache.get(tool_type)
+        if action is None:
+            action = self._cache[tool_type] = tool_cls()
+        self._action = action
 
-    def execute(self, args: dict) -> str:
+    def close(self) -> None:
+        for action in self._cache.values():
+            action.close()
+        self._cache.clear()
+
+    def execute(self, args: dict) -> ToolResponse:
         if self._action is None:
             raise RuntimeError("No tool action set. Call set_action() first.")
 
         tool_logger.log_tool_call(self._current_tool, args)
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         try:
             result = self._action.execute(args)
-            execution_time = time.time() - start_time
-            tool_logger.log_tool_success(self._current_tool, result, execution_time)
-            return result
         except Exception as e:
-            execution_time = time.time() - start_time
-            error_type = type(e).__name__
-            tool_logger.log_tool_failure(self._current_tool, str(e), error_type)
-            raise InvokerError(f"Tool execution failed: {str(e)}") from e
+            message = str(e)
+            tool_logger.log_tool_failure(
+                self._current_tool, message, e.__class__.__name__
+            )
+            return ToolResponse(
+                tool=self._current_tool,
+                args=args,
+                success=False,
+                error=f"Tool execution failed: {message}",
+            )
+
+        execution_time = (time.perf_counter_ns() - start_time) / 1e9
+        tool_logger.log_tool_success(self._current_tool, result, execution_time)
+        return ToolResponse(
+            tool=self._current_tool, args=args, success=True, result=result
+        )
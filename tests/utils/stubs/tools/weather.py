@@ -10,6 +10,9 @@ from tests.utils.constants.weather import (CITY_TEMPERATURE,
                                            DEFAULT_WEATHER_METADATA,
                                            WEATHER_METADATA)
 
+# The stub is deterministic, so each city's payload is only built once.
+_WEATHER_CACHE: Dict[str, Dict[str, Any]] = {}
+
 
 class MockWeather(Action):
     """
@@ -19,12 +22,20 @@ class MockWeather(Action):
 
     def execute(self, args: Dict[str, Any]) -> Dict[str, Any]:
         req = WeatherRequest(**args)
-        city_key = req.city.strip().lower()
+        name = req.city.title()
+        cached = _WEATHER_CACHE.get(name)
+        if cached is None:
+            cached = _WEATHER_CACHE[name] = self._build_weather(name)
+        return {**cached, "city": req.city}
+
+    @staticmethod
+    def _build_weather(name: str) -> Dict[str, Any]:
+        """Build the synthetic weather payload for a city, minus the echoed city."""
+        city_key = name.lower()
 
-        raw_temp = None
+        raw_temp = CITY_TEMPERATURE.get(city_key)
 
-        if city_key in CITY_TEMPERATURE:
-            raw_temp = CITY_TEMPERATURE[city_key]
+        if raw_temp is not None:
             temp_c = float(raw_temp)
             meta = WEATHER_METADATA.get(city_key, {})
             humidity = meta.get("humidity", 50)
@@ -55,7 +66,7 @@ class MockWeather(Action):
         sys = SysData(country="XX", sunrise=0, sunset=0)
 
         response = WeatherResponse(
-            name=req.city.title(),
+            name=name,
             weather=[weather_condition],
             main=main,
             wind=wind,
@@ -71,5 +82,4 @@ class MockWeather(Action):
             "humidity": humidity,
             "description": description,
             "wind_speed": wind_speed,
-            "city": req.city,
         }